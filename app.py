@@ -19,6 +19,14 @@ import requests
 # Add package to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Load .env once, before any module reads tokens (HF_TOKEN, TABPFN_ACCESS_TOKEN)
+# from the environment; variables that are already set win
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env"))
+except ImportError:
+    pass
+
 # ============================================================================
 # INTUITIVENESS PACKAGE IMPORTS
 # ============================================================================
@@ -27,6 +27,7 @@ from intuitiveness.app.initialization import (
     is_pure_landing_page,
     hide_sidebar_on_landing,
 )
+from intuitiveness.app.sidebar import render_sidebar
 from intuitiveness.persistence import SessionStore
 from intuitiveness.utils import SessionStateKeys
 
@@ -48,11 +49,8 @@ def run_app():
     # (Phase 1: Gradual migration - these will move to dedicated modules)
     from intuitiveness.streamlit_app import (
         # Sidebar components
-        _get_sidebar_branding_html,
         inject_right_sidebar_css,
         render_vertical_progress_sidebar,
-        render_free_navigation_sidebar,
-        reset_workflow,
         STEPS,
         # Guided mode rendering
         render_upload_step,
@@ -69,16 +67,9 @@ def run_app():
     from intuitiveness.ui import (
         render_quality_dashboard,
         render_catalog_browser,
-        render_basket_sidebar,
-        render_language_toggle_compact,
         render_tutorial,
-        render_tutorial_replay_button,
         is_tutorial_completed,
-        reset_tutorial,
-        _set_wizard_step,
-        t,
     )
-    from intuitiveness.complexity import Level4Dataset
 
     # ==========================================================================
     # INITIALIZATION
@@ -99,20 +90,8 @@ def run_app():
     if is_pure_landing_page():
         hide_sidebar_on_landing()
     else:
-        _render_sidebar(
-            store=store,
-            branding_html=_get_sidebar_branding_html(),
-            render_basket_sidebar=render_basket_sidebar,
-            render_language_toggle_compact=render_language_toggle_compact,
-            render_free_navigation_sidebar=render_free_navigation_sidebar,
-            render_tutorial_replay_button=render_tutorial_replay_button,
-            is_tutorial_completed=is_tutorial_completed,
-            reset_tutorial=reset_tutorial,
-            reset_workflow=reset_workflow,
-            _set_wizard_step=_set_wizard_step,
-            Level4Dataset=Level4Dataset,
-            t=t,
-        )
+        with st.sidebar:
+            render_sidebar(store)
 
     # ==========================================================================
     # MAIN CONTENT ROUTING
@@ -153,122 +132,6 @@ def run_app():
     render_vertical_progress_sidebar()
 
 
-def _render_sidebar(
-    store,
-    branding_html,
-    render_basket_sidebar,
-    render_language_toggle_compact,
-    render_free_navigation_sidebar,
-    render_tutorial_replay_button,
-    is_tutorial_completed,
-    reset_tutorial,
-    reset_workflow,
-    _set_wizard_step,
-    Level4Dataset,
-    t,
-):
-    """
-    Render the left sidebar with all controls.
-
-    Components:
-    - Branding (007-streamlit-design-makeup)
-    - Language toggle (006-playwright-mcp-e2e)
-    - Dataset basket (008-datagouv-search)
-    - Mode toggle (002-ascent-functionality)
-    - Quality tools (009-010)
-    - Session persistence (005-session-persistence)
-    """
-    with st.sidebar:
-        # Branding
-        st.markdown(branding_html, unsafe_allow_html=True)
-        st.markdown("---")
-
-        # Language toggle (006)
-        render_language_toggle_compact()
-        st.divider()
-
-        # Dataset basket (008)
-        if render_basket_sidebar():
-            raw_data = st.session_state.datagouv_loaded_datasets.copy()
-            st.session_state.raw_data = raw_data
-            st.session_state.datasets['l4'] = Level4Dataset(raw_data)
-            st.session_state.datagouv_loaded_datasets = {}
-            st.session_state.current_step = 0
-            _set_wizard_step(1)
-            reset_tutorial()
-            st.rerun()
-
-        # Mode toggle
-        st.markdown(f"### {t('exploration_mode')}")
-        mode = st.radio(
-            t('select_mode'),
-            options=['guided', 'free'],
-            format_func=lambda x: t('step_by_step') if x == 'guided' else t('free_exploration'),
-            index=0 if st.session_state.nav_mode == 'guided' else 1,
-            key='mode_selector',
-            help=t('step_by_step_help')
-        )
-
-        if mode != st.session_state.nav_mode and not st.session_state.get('loaded_session_graph'):
-            st.session_state.nav_mode = mode
-            st.rerun()
-
-        st.divider()
-
-        # Quality tools (009-010)
-        st.markdown("### Data modeling Tools")
-        quality_tool = st.radio(
-            "Select tool",
-            options=['none', 'quality', 'catalog'],
-            format_func=lambda x: {
-                'none': 'None',
-                'quality': '📊 Quality Assessment',
-                'catalog': '📁 Dataset Catalog'
-            }.get(x, x),
-            index=0,
-            key='quality_tool_selector',
-            label_visibility='collapsed',
-        )
-        if quality_tool != st.session_state.get('active_quality_tool', 'none'):
-            st.session_state.active_quality_tool = quality_tool
-            st.rerun()
-
-        st.divider()
-
-        # Free navigation sidebar (002)
-        if st.session_state.nav_mode == 'free' and st.session_state.nav_session:
-            render_free_navigation_sidebar()
-            st.divider()
-
-        if st.button(f"🔄 {t('reset_workflow')}"):
-            reset_workflow()
-            st.rerun()
-
-        # Tutorial replay (007)
-        if is_tutorial_completed() and st.session_state.raw_data is not None:
-            render_tutorial_replay_button()
-
-        # Session persistence (005)
-        st.markdown(f"### {t('sidebar_session')}")
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button(f"💾 {t('save_button')}", help=t('save_help')):
-                try:
-                    result = store.save(force=True)
-                    if result.success:
-                        st.success(t('saved_success'))
-                    else:
-                        st.warning(t('save_too_large'))
-                except Exception as e:
-                    st.error(t('save_failed', error=str(e)))
-        with col2:
-            if st.button(f"🗑️ {t('clear_button')}", help=t('clear_help')):
-                store.clear()
-                reset_workflow()
-                st.session_state.session_recovery_handled = True
-                st.rerun()
-
-
 def _render_guided_mode(
     STEPS,
     render_upload_step,
@@ -32,66 +32,52 @@ from intuitiveness.ui import (
 from intuitiveness.persistence import SessionStore
 
 
-def _get_sidebar_branding_html() -> str:
-    """Generate animated gear cube logo HTML for sidebar."""
+# st.fragment (Streamlit >= 1.37) reruns only the decorated section when one of
+# its widgets changes, instead of the whole app; older versions render inline.
+_fragment = getattr(st, "fragment", lambda func: func)
 
-    # Generate cube faces HTML (scaled down version)
-    def make_gear(level: str, spin: str) -> str:
-        return f'<div class="sb-gear sb-{level} sb-spin-{spin}"></div>'
+# Radio labels, defined once instead of rebuilt on every rerun
+_MODE_LABEL_KEYS = {'guided': 'step_by_step', 'free': 'free_exploration'}
+_QUALITY_TOOL_LABELS = {
+    'none': 'None',
+    'quality': '📊 Quality Assessment',
+    'catalog': '📁 Dataset Catalog',
+}
 
-    patterns = {
-        'front':  [('l4','cw'), ('l3','ccw'), ('l4','cw'),
-                   ('l2','ccw'), ('l0','cw'), ('l2','ccw'),
-                   ('l4','cw'), ('l3','ccw'), ('l4','cw')],
-        'back':   [('l3','cw'), ('l2','ccw'), ('l3','cw'),
-                   ('l1','ccw'), ('l0','cw'), ('l1','ccw'),
-                   ('l3','cw'), ('l2','ccw'), ('l3','cw')],
-        'right':  [('l4','cw'), ('l2','ccw'), ('l3','cw'),
-                   ('l3','ccw'), ('l1','cw'), ('l2','ccw'),
-                   ('l4','cw'), ('l2','ccw'), ('l3','cw')],
-        'left':   [('l3','cw'), ('l2','ccw'), ('l4','cw'),
-                   ('l2','ccw'), ('l1','cw'), ('l3','ccw'),
-                   ('l3','cw'), ('l2','ccw'), ('l4','cw')],
-        'top':    [('l4','cw'), ('l4','ccw'), ('l4','cw'),
-                   ('l4','ccw'), ('l2','cw'), ('l4','ccw'),
-                   ('l4','cw'), ('l4','ccw'), ('l4','cw')],
-        'bottom': [('l3','cw'), ('l3','ccw'), ('l3','cw'),
-                   ('l3','ccw'), ('l1','cw'), ('l3','ccw'),
-                   ('l3','cw'), ('l3','ccw'), ('l3','cw')],
-    }
 
-    cube_faces = ''
-    for face, gears in patterns.items():
-        gears_html = ''.join(make_gear(g[0], g[1]) for g in gears)
-        cube_faces += f'<div class="sb-cube-face sb-{face}">{gears_html}</div>'
+def _format_mode_label(mode: str) -> str:
+    """Translate a navigation mode into its display label."""
+    return t(_MODE_LABEL_KEYS[mode])
+
 
-    return f"""
+# Static stylesheet for the animated cube (plain string, no f-string escaping)
+_SIDEBAR_CSS = """
     <style>
     /* Sidebar animated cube - scaled down */
-    .sb-cube-container {{
+    .sb-cube-container {
         width: 100px;
         height: 100px;
         perspective: 400px;
         margin: 0 auto;
-    }}
-    .sb-cube {{
+    }
+    .sb-cube {
         width: 100px;
         height: 100px;
         transform-style: preserve-3d;
         animation: sb-shuffle 16s ease-in-out infinite;
-    }}
-    @keyframes sb-shuffle {{
-        0%   {{ transform: rotateX(-15deg) rotateY(0deg); }}
-        8%   {{ transform: rotateX(25deg) rotateY(45deg); }}
-        16%  {{ transform: rotateX(-30deg) rotateY(120deg); }}
-        24%  {{ transform: rotateX(20deg) rotateY(200deg); }}
-        32%  {{ transform: rotateX(-25deg) rotateY(280deg); }}
-        40%  {{ transform: rotateX(35deg) rotateY(340deg); }}
-        55%  {{ transform: rotateX(-10deg) rotateY(380deg); }}
-        70%  {{ transform: rotateX(-15deg) rotateY(360deg); }}
-        100% {{ transform: rotateX(-15deg) rotateY(360deg); }}
-    }}
-    .sb-cube-face {{
+    }
+    @keyframes sb-shuffle {
+        0%   { transform: rotateX(-15deg) rotateY(0deg); }
+        8%   { transform: rotateX(25deg) rotateY(45deg); }
+        16%  { transform: rotateX(-30deg) rotateY(120deg); }
+        24%  { transform: rotateX(20deg) rotateY(200deg); }
+        32%  { transform: rotateX(-25deg) rotateY(280deg); }
+        40%  { transform: rotateX(35deg) rotateY(340deg); }
+        55%  { transform: rotateX(-10deg) rotateY(380deg); }
+        70%  { transform: rotateX(-15deg) rotateY(360deg); }
+        100% { transform: rotateX(-15deg) rotateY(360deg); }
+    }
+    .sb-cube-face {
         position: absolute;
         width: 100px;
         height: 100px;
@@ -102,20 +88,20 @@ def _get_sidebar_branding_html() -> str:
         background: rgba(0, 47, 167, 0.03);
         border-radius: 6px;
         backface-visibility: visible;
-    }}
-    .sb-cube-face.sb-front  {{ transform: translateZ(50px); }}
-    .sb-cube-face.sb-back   {{ transform: rotateY(180deg) translateZ(50px); }}
-    .sb-cube-face.sb-right  {{ transform: rotateY(90deg) translateZ(50px); }}
-    .sb-cube-face.sb-left   {{ transform: rotateY(-90deg) translateZ(50px); }}
-    .sb-cube-face.sb-top    {{ transform: rotateX(90deg) translateZ(50px); }}
-    .sb-cube-face.sb-bottom {{ transform: rotateX(-90deg) translateZ(50px); }}
-    .sb-gear {{
+    }
+    .sb-cube-face.sb-front  { transform: translateZ(50px); }
+    .sb-cube-face.sb-back   { transform: rotateY(180deg) translateZ(50px); }
+    .sb-cube-face.sb-right  { transform: rotateY(90deg) translateZ(50px); }
+    .sb-cube-face.sb-left   { transform: rotateY(-90deg) translateZ(50px); }
+    .sb-cube-face.sb-top    { transform: rotateX(90deg) translateZ(50px); }
+    .sb-cube-face.sb-bottom { transform: rotateX(-90deg) translateZ(50px); }
+    .sb-gear {
         width: 28px;
         height: 28px;
         border-radius: 50%;
         position: relative;
-    }}
-    .sb-gear::after {{
+    }
+    .sb-gear::after {
         content: '';
         position: absolute;
         width: 100%;
@@ -134,17 +120,53 @@ def _get_sidebar_branding_html() -> str:
             0% 35%, 8% 27%, 0% 15%, 15% 12%,
             20% 0%, 27% 8%, 35% 0%, 42% 8%
         );
-    }}
-    .sb-gear.sb-l0 {{ background: #002fa7; }}
-    .sb-gear.sb-l1 {{ background: #0041d1; }}
-    .sb-gear.sb-l2 {{ background: #3b82f6; }}
-    .sb-gear.sb-l3 {{ background: #60a5fa; }}
-    .sb-gear.sb-l4 {{ background: #93c5fd; }}
-    .sb-gear.sb-spin-cw {{ animation: sb-spin-cw 6s linear infinite; }}
-    .sb-gear.sb-spin-ccw {{ animation: sb-spin-ccw 6s linear infinite; }}
-    @keyframes sb-spin-cw {{ to {{ transform: rotate(360deg); }} }}
-    @keyframes sb-spin-ccw {{ to {{ transform: rotate(-360deg); }} }}
-    </style>
+    }
+    .sb-gear.sb-l0 { background: #002fa7; }
+    .sb-gear.sb-l1 { background: #0041d1; }
+    .sb-gear.sb-l2 { background: #3b82f6; }
+    .sb-gear.sb-l3 { background: #60a5fa; }
+    .sb-gear.sb-l4 { background: #93c5fd; }
+    .sb-gear.sb-spin-cw { animation: sb-spin-cw 6s linear infinite; }
+    .sb-gear.sb-spin-ccw { animation: sb-spin-ccw 6s linear infinite; }
+    @keyframes sb-spin-cw { to { transform: rotate(360deg); } }
+    @keyframes sb-spin-ccw { to { transform: rotate(-360deg); } }
+    </style>"""
+
+
+def _build_sidebar_branding_html() -> str:
+    """Generate animated gear cube logo HTML for sidebar."""
+
+    # Generate cube faces HTML (scaled down version)
+    def make_gear(level: str, spin: str) -> str:
+        return f'<div class="sb-gear sb-{level} sb-spin-{spin}"></div>'
+
+    patterns = {
+        'front':  [('l4','cw'), ('l3','ccw'), ('l4','cw'),
+                   ('l2','ccw'), ('l0','cw'), ('l2','ccw'),
+                   ('l4','cw'), ('l3','ccw'), ('l4','cw')],
+        'back':   [('l3','cw'), ('l2','ccw'), ('l3','cw'),
+                   ('l1','ccw'), ('l0','cw'), ('l1','ccw'),
+                   ('l3','cw'), ('l2','ccw'), ('l3','cw')],
+        'right':  [('l4','cw'), ('l2','ccw'), ('l3','cw'),
+                   ('l3','ccw'), ('l1','cw'), ('l2','ccw'),
+                   ('l4','cw'), ('l2','ccw'), ('l3','cw')],
+        'left':   [('l3','cw'), ('l2','ccw'), ('l4','cw'),
+                   ('l2','ccw'), ('l1','cw'), ('l3','ccw'),
+                   ('l3','cw'), ('l2','ccw'), ('l4','cw')],
+        'top':    [('l4','cw'), ('l4','ccw'), ('l4','cw'),
+                   ('l4','ccw'), ('l2','cw'), ('l4','ccw'),
+                   ('l4','cw'), ('l4','ccw'), ('l4','cw')],
+        'bottom': [('l3','cw'), ('l3','ccw'), ('l3','cw'),
+                   ('l3','ccw'), ('l1','cw'), ('l3','ccw'),
+                   ('l3','cw'), ('l3','ccw'), ('l3','cw')],
+    }
+
+    cube_faces = ''
+    for face, gears in patterns.items():
+        gears_html = ''.join(make_gear(g[0], g[1]) for g in gears)
+        cube_faces += f'<div class="sb-cube-face sb-{face}">{gears_html}</div>'
+
+    return _SIDEBAR_CSS + f"""
     <div style="text-align: center; padding: 1rem 0;">
         <div class="sb-cube-container">
             <div class="sb-cube">
@@ -161,6 +183,16 @@ def _get_sidebar_branding_html() -> str:
     """
 
 
+# The branding is fully static, so build it once at import instead of on
+# every Streamlit rerun.
+_SIDEBAR_BRANDING_HTML = _build_sidebar_branding_html()
+
+
+def _get_sidebar_branding_html() -> str:
+    """Return the pre-built animated gear cube logo HTML for sidebar."""
+    return _SIDEBAR_BRANDING_HTML
+
+
 def render_sidebar(store: SessionStore) -> None:
     """
     Render complete sidebar with all controls.
@@ -173,7 +205,7 @@ def render_sidebar(store: SessionStore) -> None:
     st.markdown("---")
     
     # Language toggle (006-playwright-mcp-e2e: Bilingual support)
-    render_language_toggle_compact()
+    _render_language_toggle()
     st.divider()
     
     # Dataset basket in sidebar (008-datagouv-search)
@@ -210,6 +242,12 @@ def render_sidebar(store: SessionStore) -> None:
     _render_persistence_buttons(store)
 
 
+@_fragment
+def _render_language_toggle() -> None:
+    """Render the compact EN/FR toggle as an isolated fragment."""
+    render_language_toggle_compact()
+
+
 def _handle_basket_continue() -> None:
     """Handle user clicking 'Continue' in dataset basket."""
     # User clicked "Continue" - proceed with loaded datasets
@@ -227,36 +265,38 @@ def _handle_basket_continue() -> None:
     st.rerun()
 
 
+@_fragment
 def _render_mode_selector() -> None:
     """Render guided/free mode selector."""
+    nav_mode = st.session_state.nav_mode
     st.markdown(f"### {t('exploration_mode')}")
     mode = st.radio(
         t('select_mode'),
         options=['guided', 'free'],
-        format_func=lambda x: t('step_by_step') if x == 'guided' else t('free_exploration'),
-        index=0 if st.session_state.nav_mode == 'guided' else 1,
+        format_func=_format_mode_label,
+        index=0 if nav_mode == 'guided' else 1,
         key='mode_selector',
         help=t('step_by_step_help')
     )
     
     # Sync radio with nav_mode, but skip if in ascent mode (has loaded_session_graph)
     # During ascent, we force free mode regardless of radio selection
-    if mode != st.session_state.nav_mode and not st.session_state.get('loaded_session_graph'):
+    if mode == nav_mode:
+        return
+    ascent_active = bool(st.session_state.get('loaded_session_graph'))
+    if not ascent_active:
         st.session_state.nav_mode = mode
         st.rerun()
 
 
+@_fragment
 def _render_quality_tools_selector() -> None:
     """Render quality tools selector (assessment/catalog)."""
     st.markdown("### Data modeling Tools")
     quality_tool = st.radio(
         "Select tool",
         options=['none', 'quality', 'catalog'],
-        format_func=lambda x: {
-            'none': 'None',
-            'quality': '📊 Quality Assessment',
-            'catalog': '📁 Dataset Catalog'
-        }.get(x, x),
+        format_func=_QUALITY_TOOL_LABELS.get,
         index=0,
         key='quality_tool_selector',
         label_visibility='collapsed',
@@ -266,6 +306,7 @@ def _render_quality_tools_selector() -> None:
         st.rerun()
 
 
+@_fragment
 def _render_persistence_buttons(store: SessionStore) -> None:
     """Render session save/clear buttons."""
     st.markdown(f"### {t('sidebar_session')}")
@@ -28,12 +28,25 @@ Example:
 >>> print(l2.get_data().head())
 """
 
+import importlib.util
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional, Dict, Any, Tuple
 import pandas as pd
 import numpy as np
 
 from complexity import Level1Dataset, Level2Dataset
 
+# Checked once at import; the heavy import itself is deferred to first use
+_SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+# Bounded LRU of value string -> normalized embedding, shared across calls
+_VALUE_EMBEDDING_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_VALUE_EMBEDDING_CACHE_SIZE = 1024
+_VALUE_EMBEDDING_CACHE_LOCK = threading.Lock()
+
 
 def enrich_l1_to_l2(
     vector: Level1Dataset,
@@ -108,11 +121,11 @@ def enrich_l1_to_l2(
     # Get vector data
     series = vector.get_data()
 
-    # Create DataFrame with values
-    df = pd.DataFrame({
-        'value': series.values,
-        'index': series.index if series.index is not None else range(len(series))
-    })
+    # Create DataFrame with values, keeping the original labels as 'index'
+    # (copy=False wraps the existing arrays instead of copying them)
+    df = pd.DataFrame(
+        {'value': series.to_numpy(), 'index': series.index}, copy=False
+    )
 
     # Categorize based on value ranges (for numeric data)
     if pd.api.types.is_numeric_dtype(series):
@@ -145,6 +158,25 @@ def enrich_l1_to_l2(
     return l2
 
 
+@lru_cache(maxsize=64)
+def _resolve_numeric_domains(domains: Tuple[str, ...]) -> Tuple[str, str, str]:
+    """
+    Pick the (high, mid, low) domain names used for numeric binning.
+
+    - "high": first domain containing "high", else the first domain
+    - "low": first domain containing "low", else the last domain
+    - "mid": first domain containing "mid"/"medium", else the middle
+      domain (or "medium" when there are two domains or fewer)
+    """
+    high_domain = next((d for d in domains if "high" in d.lower()), domains[0])
+    low_domain = next((d for d in domains if "low" in d.lower()), domains[-1])
+    mid_domain = next(
+        (d for d in domains if "mid" in d.lower() or "medium" in d.lower()),
+        domains[len(domains)//2] if len(domains) > 2 else "medium"
+    )
+    return high_domain, mid_domain, low_domain
+
+
 def _categorize_numeric_values(
     series: pd.Series,
     domains: List[str],
@@ -179,24 +211,85 @@ def _categorize_numeric_values(
     high_threshold = median + (threshold * std)
     low_threshold = median - (threshold * std)
 
-    categories = []
-    for value in series:
-        if pd.isna(value):
-            categories.append("unknown")
-        elif value >= high_threshold:
-            # Assign to "high" domain (first domain matching "high")
-            high_domain = next((d for d in domains if "high" in d.lower()), domains[0])
-            categories.append(high_domain)
-        elif value <= low_threshold:
-            # Assign to "low" domain
-            low_domain = next((d for d in domains if "low" in d.lower()), domains[-1])
-            categories.append(low_domain)
-        else:
-            # Assign to middle domain
-            mid_domain = next((d for d in domains if "mid" in d.lower() or "medium" in d.lower()), domains[len(domains)//2] if len(domains) > 2 else "medium")
-            categories.append(mid_domain)
+    high_domain, mid_domain, low_domain = _resolve_numeric_domains(tuple(domains))
 
-    return categories
+    # Single vectorized pass: first matching condition wins
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    conditions = [
+        np.isnan(values),
+        values >= high_threshold,
+        values <= low_threshold,
+    ]
+    choices = ["unknown", high_domain, low_domain]
+
+    return np.select(conditions, choices, default=mid_domain).tolist()
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_model():
+    """
+    Load the multilingual-e5-small model once per process (Spec 004: FR-007).
+
+    Raises ImportError if sentence-transformers is not installed.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer('intfloat/multilingual-e5-small')
+
+
+@lru_cache(maxsize=32)
+def _encode_domains(domains: Tuple[str, ...]):
+    """
+    Encode domain names once per distinct domain set.
+
+    Embeddings are normalized so a dot product is the cosine similarity.
+    """
+    return _get_embedding_model().encode(
+        list(domains), convert_to_tensor=True, normalize_embeddings=True
+    )
+
+
+def _encode_values(values: List[str]):
+    """
+    Encode value strings, reusing cached embeddings.
+
+    Only distinct values missing from the cache are sent to the model.
+    The cache keeps the most recent _VALUE_EMBEDDING_CACHE_SIZE values and
+    is locked, as Streamlit sessions share it across threads.
+    Returns a (len(values), dim) tensor of normalized embeddings.
+    """
+    import torch
+
+    lookup = {}
+    missing = []
+    with _VALUE_EMBEDDING_CACHE_LOCK:
+        for value in dict.fromkeys(values):
+            if value in _VALUE_EMBEDDING_CACHE:
+                _VALUE_EMBEDDING_CACHE.move_to_end(value)
+                lookup[value] = _VALUE_EMBEDDING_CACHE[value]
+            else:
+                missing.append(value)
+
+    if missing:
+        # Encode outside the lock so concurrent sessions don't serialize on the model
+        embeddings = _get_embedding_model().encode(
+            missing, convert_to_tensor=True, normalize_embeddings=True
+        )
+        # Clone each row so cached entries don't keep the whole batch tensor alive
+        lookup.update(
+            (value, embedding.clone()) for value, embedding in zip(missing, embeddings)
+        )
+        with _VALUE_EMBEDDING_CACHE_LOCK:
+            for value in missing[-_VALUE_EMBEDDING_CACHE_SIZE:]:
+                _VALUE_EMBEDDING_CACHE[value] = lookup[value]
+                _VALUE_EMBEDDING_CACHE.move_to_end(value)
+            while len(_VALUE_EMBEDDING_CACHE) > _VALUE_EMBEDDING_CACHE_SIZE:
+                _VALUE_EMBEDDING_CACHE.popitem(last=False)
+
+    # Stack each distinct embedding once, then expand to one row per value
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    distinct = torch.stack([lookup[value] for value in uniques])
+    return distinct[torch.from_numpy(codes)]
 
 
 def _categorize_with_semantic_matching(
@@ -227,44 +320,43 @@ def _categorize_with_semantic_matching(
     List[str]
         Category for each value
     """
-    try:
-        from sentence_transformers import SentenceTransformer
-        import torch
+    global _SENTENCE_TRANSFORMERS_AVAILABLE
 
-        # Load multilingual-e5-small model (Spec 004: FR-007)
-        model = SentenceTransformer('intfloat/multilingual-e5-small')
+    if not _SENTENCE_TRANSFORMERS_AVAILABLE:
+        # Fall back to keyword matching if sentence-transformers not available
+        print("Warning: sentence-transformers not installed, falling back to keyword matching")
+        return _categorize_with_keywords(series, domains, keyword_vocabularies)
 
-        # Encode domains
-        domain_embeddings = model.encode(domains, convert_to_tensor=True)
+    if series.empty:
+        return []
 
-        # Encode values
-        values_str = [str(v) for v in series]
-        value_embeddings = model.encode(values_str, convert_to_tensor=True)
+    try:
+        # Domain embeddings are cached per distinct domain set
+        domain_embeddings = _encode_domains(tuple(domains))
+
+        # Encode values (model and per-value embeddings are cached, Spec 004: FR-007)
+        values_str = series.astype(str).tolist()
+        value_embeddings = _encode_values(values_str)
+    except ImportError as e:
+        # find_spec only checks that the package is present; it can still fail to import
+        _SENTENCE_TRANSFORMERS_AVAILABLE = False
+        print(f"Warning: sentence-transformers failed to import ({e}), falling back to keyword matching")
+        return _categorize_with_keywords(series, domains, keyword_vocabularies)
 
-        # Compute cosine similarity
-        from torch.nn.functional import cosine_similarity
+    # Compute all value × domain cosine similarities in one matrix product
+    similarities = value_embeddings @ domain_embeddings.T
+    max_sims, best_domain_idx = similarities.max(dim=1)
+    max_sims = max_sims.cpu().numpy()
+    best_domain_idx = best_domain_idx.cpu().numpy()
 
-        categories = []
-        for i, value_emb in enumerate(value_embeddings):
-            similarities = [
-                cosine_similarity(value_emb.unsqueeze(0), domain_emb.unsqueeze(0)).item()
-                for domain_emb in domain_embeddings
-            ]
-
-            max_sim = max(similarities)
-            if max_sim >= threshold:
-                best_domain_idx = similarities.index(max_sim)
-                categories.append(domains[best_domain_idx])
-            else:
-                # No match above threshold
-                categories.append("uncategorized")
-
-        return categories
+    # No match above threshold -> "uncategorized"
+    categories = np.where(
+        max_sims >= threshold,
+        np.asarray(domains, dtype=object)[best_domain_idx],
+        "uncategorized"
+    ).tolist()
 
-    except ImportError:
-        # Fall back to keyword matching if sentence-transformers not available
-        print("Warning: sentence-transformers not installed, falling back to keyword matching")
-        return _categorize_with_keywords(series, domains, keyword_vocabularies)
+    return categories
 
 
 def _categorize_with_keywords(
@@ -297,19 +389,20 @@ def _categorize_with_keywords(
             categories.append(domains[domain_idx])
         return categories
 
+    # One precompiled alternation per domain (domains without keywords never match)
+    domain_patterns = [
+        (domain, re.compile('|'.join(re.escape(kw.lower()) for kw in keywords)))
+        for domain, keywords in keyword_vocabularies.items()
+        if keywords
+    ]
+
     categories = []
     for value in series:
         value_str = str(value).lower()
-        matched = False
-
-        for domain, keywords in keyword_vocabularies.items():
-            if any(kw.lower() in value_str for kw in keywords):
-                categories.append(domain)
-                matched = True
-                break
-
-        if not matched:
-            categories.append("uncategorized")
+        categories.append(next(
+            (domain for domain, pattern in domain_patterns if pattern.search(value_str)),
+            "uncategorized"
+        ))
 
     return categories
 
@@ -346,12 +439,19 @@ def get_domain_statistics(
     if 'category' not in df.columns:
         raise ValueError("L2 table missing 'category' column - not enriched?")
 
+    # One pass over the column; everything else derives from the counts
+    category_counts = df['category'].value_counts()
+    total_values = len(df)
+    uncategorized_count = int(category_counts.get('uncategorized', 0))
+
     stats = {
-        "total_values": len(df),
-        "categories": df['category'].unique().tolist(),
-        "category_counts": df['category'].value_counts().to_dict(),
-        "uncategorized_count": (df['category'] == 'uncategorized').sum(),
-        "categorization_rate": 1.0 - ((df['category'] == 'uncategorized').sum() / len(df))
+        "total_values": total_values,
+        "categories": category_counts.index.tolist(),
+        "category_counts": category_counts.to_dict(),
+        "uncategorized_count": uncategorized_count,
+        "categorization_rate": (
+            1.0 - (uncategorized_count / total_values) if total_values else float('nan')
+        )
     }
 
     return stats
@@ -32,12 +32,20 @@ Example:
 >>> # No orphan nodes guaranteed
 """
 
+import importlib.util
+from collections import Counter
 from typing import Optional, List, Set, Dict, Any
+import numpy as np
 import pandas as pd
 import networkx as nx
 
 from complexity import Level2Dataset, Level3Dataset
 
+# Optional compact backend for very large graphs (pip install igraph).
+# Only used when requested explicitly with backend="igraph": it returns an
+# igraph.Graph, which networkx-based consumers can't traverse.
+_IGRAPH_AVAILABLE = importlib.util.find_spec("igraph") is not None
+
 
 class OrphanNodeError(Exception):
     """
@@ -57,7 +65,9 @@ def build_l2_to_l3_graph(
     entity_column: str,
     value_column: Optional[str] = None,
     relationship_type: str = "belongs_to",
-    validate_orphans: bool = True
+    validate_orphans: bool = True,
+    backend: str = "networkx",
+    integer_ids: bool = False
 ) -> Level3Dataset:
     """
     Build L3 graph from L2 table by extracting column as new entity type.
@@ -93,6 +103,15 @@ def build_l2_to_l3_graph(
         Relationship label (default: "belongs_to")
     validate_orphans : bool
         If True (default), raises OrphanNodeError if orphans detected
+    backend : str
+        Graph representation: "networkx" (default) or "igraph" (opt-in:
+        packed C edge arrays, far smaller for large graphs; requires
+        igraph, and the L3 data is then an igraph.Graph, not a networkx one)
+    integer_ids : bool
+        If True, nodes are keyed by dense integer codes instead of the
+        original identifiers (cheaper hashing, smaller graph for string
+        ids). Each node keeps its identifier in a "label" attribute and
+        l3._metadata["node_labels"] maps code -> identifier.
 
     Returns:
     --------
@@ -104,7 +123,9 @@ def build_l2_to_l3_graph(
     OrphanNodeError
         If graph would contain orphan nodes and validate_orphans=True
     ValueError
-        If entity_column not found in table
+        If entity_column not found in table, or unknown backend
+    ImportError
+        If backend="igraph" and igraph is not installed
 
     Example:
     --------
@@ -142,40 +163,30 @@ def build_l2_to_l3_graph(
     if entity_column not in df.columns:
         raise ValueError(f"Column '{entity_column}' not found in table. Available: {list(df.columns)}")
 
-    # Create NetworkX graph
-    G = nx.DiGraph()
-
-    # Add original entities as nodes (Type 1)
-    original_entities = df.index.tolist() if df.index.name else range(len(df))
-    for entity in original_entities:
-        G.add_node(entity, node_type="original", entity_type="row")
-
-    # Add new entities from entity_column as nodes (Type 2)
-    new_entities = df[entity_column].unique()
-    for entity in new_entities:
-        if pd.notna(entity):  # Skip NaN values
-            G.add_node(entity, node_type="extracted", entity_type=entity_column)
-
-    # Add edges between original and new entities
-    for idx, row in df.iterrows():
-        original_entity = idx if df.index.name else original_entities[idx if isinstance(idx, int) else list(df.index).index(idx)]
-        new_entity = row[entity_column]
+    # Row identifiers: the named index, otherwise row positions. Edges are
+    # sourced by boolean mask on this index, never by per-row position lookup.
+    original_entities = df.index if df.index.name else pd.RangeIndex(len(df))
 
-        if pd.notna(new_entity):
-            edge_attrs = {
-                "relationship": relationship_type,
-                "source_column": entity_column
-            }
+    # Pull raw column arrays once; everything below works on these
+    entity_values = df[entity_column].to_numpy()
+    has_entity = pd.notna(entity_values)
+    has_weights = bool(value_column) and value_column in df.columns
 
-            # Add edge weight if value_column specified
-            if value_column and value_column in df.columns:
-                edge_attrs["weight"] = row[value_column]
+    # Build the edge list as a DataFrame and add all edges at once. Attributes
+    # common to every edge are kept once, not repeated as per-row columns.
+    edges_df = pd.DataFrame({
+        "source": original_entities[has_entity].to_numpy(),
+        "target": entity_values[has_entity],
+    })
+    shared_attrs = {"relationship": relationship_type, "source_column": entity_column}
 
-            G.add_edge(original_entity, new_entity, **edge_attrs)
+    # Add edge weight if value_column specified
+    if has_weights:
+        edges_df["weight"] = df[value_column].to_numpy()[has_entity]
 
-    # Validate no orphan nodes (Design Constraint 1)
+    # Validate no orphan nodes (Design Constraint 1) before building the graph
     if validate_orphans:
-        orphans = validate_no_orphan_nodes(G)
+        orphans = _find_orphan_rows(original_entities[~has_entity], edges_df)
         if orphans:
             raise OrphanNodeError(
                 f"Graph construction would create {len(orphans)} orphan node(s).\\n"
@@ -187,6 +198,49 @@ def build_l2_to_l3_graph(
                 f"  3. Add relationship columns to connect isolated entities"
             )
 
+    # Add new entities from entity_column as nodes (Type 2); NaN values are
+    # already masked out, so uniqueness is a single hash-based pass in C
+    new_entities = pd.unique(entity_values[has_entity])
+
+    node_labels = None
+    if integer_ids:
+        original_entities, new_entities, node_labels = _encode_node_ids(
+            original_entities, new_entities, edges_df
+        )
+
+    if backend == "networkx":
+        G = _build_networkx_graph(
+            edges_df, shared_attrs, original_entities, new_entities, entity_column
+        )
+        node_count, edge_count = G.number_of_nodes(), G.number_of_edges()
+    elif backend == "igraph":
+        G = _build_igraph_graph(
+            edges_df, shared_attrs, original_entities, new_entities, entity_column
+        )
+        node_count, edge_count = G.vcount(), G.ecount()
+    else:
+        raise ValueError(f"Unknown backend '{backend}'. Use 'networkx' or 'igraph'")
+
+    if node_labels is not None:
+        if backend == "networkx":
+            nx.set_node_attributes(G, dict(enumerate(node_labels)), "label")
+        else:
+            G.vs["label"] = node_labels[G.vs["name"]].tolist()
+
+    # With unique row ids every row node has at most one edge, so components
+    # are stars around the extracted entities. Unless a row id doubles as an
+    # entity id, the graph is weakly connected iff there is one entity and
+    # every row links to it. Rows sharing an id merge into one node that can
+    # link several entities, so that case is checked on the graph itself.
+    is_connected = None
+    if node_count and not original_entities.isin(new_entities).any():
+        if original_entities.is_unique:
+            is_connected = node_count == 1 or (len(new_entities) == 1 and bool(has_entity.all()))
+        elif backend == "networkx":
+            is_connected = nx.is_weakly_connected(G)
+        else:
+            is_connected = G.is_connected(mode="weak")
+
     # Create L3 dataset
     l3 = Level3Dataset(G)
 
@@ -195,15 +249,136 @@ def build_l2_to_l3_graph(
         "built_from": "L2_table",
         "entity_column": entity_column,
         "relationship_type": relationship_type,
-        "node_count": G.number_of_nodes(),
-        "edge_count": G.number_of_edges(),
+        "node_count": node_count,
+        "edge_count": edge_count,
         "bipartite": True,
+        "is_connected": is_connected,
+        "backend": backend,
+        "node_labels": node_labels,
         "source_operation": f"Built graph extracting '{entity_column}' as entities"
     }
 
     return l3
 
 
+def _encode_node_ids(
+    original_entities: pd.Index,
+    new_entities: np.ndarray,
+    edges_df: pd.DataFrame
+):
+    """
+    Replace node identifiers by dense integer codes.
+
+    Rows and extracted entities share one code space, so an identifier used
+    by both still maps to a single node. edges_df is recoded in place.
+    Returns (row codes, entity codes, code -> identifier Index).
+    """
+    codes, labels = pd.factorize(np.concatenate([original_entities.to_numpy(), new_entities]))
+    labels = pd.Index(labels)
+
+    edges_df["source"] = labels.get_indexer(edges_df["source"])
+    edges_df["target"] = labels.get_indexer(edges_df["target"])
+
+    row_count = len(original_entities)
+    return pd.Index(codes[:row_count]), codes[row_count:], labels
+
+
+def _build_networkx_graph(
+    edges_df: pd.DataFrame,
+    shared_attrs: Dict[str, Any],
+    original_entities: pd.Index,
+    new_entities: np.ndarray,
+    entity_column: str
+) -> nx.DiGraph:
+    """Build the bipartite L3 graph as a NetworkX DiGraph."""
+    G = nx.DiGraph()
+
+    # Nodes go in before edges so node order is rows first, then entities
+    # Add original entities as nodes (Type 1), including rows without an edge
+    G.add_nodes_from(original_entities, node_type="original", entity_type="row")
+
+    # Add new entities from entity_column as nodes (Type 2)
+    G.add_nodes_from(new_entities, node_type="extracted", entity_type=entity_column)
+
+    # Shared attributes go in as keyword arguments: no per-edge attribute
+    # dict is built on the way in, only the one each edge stores
+    if "weight" in edges_df:
+        G.add_weighted_edges_from(
+            zip(edges_df["source"], edges_df["target"], edges_df["weight"]), **shared_attrs
+        )
+    else:
+        G.add_edges_from(zip(edges_df["source"], edges_df["target"]), **shared_attrs)
+
+    return G
+
+
+def _build_igraph_graph(
+    edges_df: pd.DataFrame,
+    shared_attrs: Dict[str, Any],
+    original_entities: pd.Index,
+    new_entities: np.ndarray,
+    entity_column: str
+):
+    """
+    Build the bipartite L3 graph as an igraph.Graph.
+
+    Edges are stored in packed C arrays instead of NetworkX's nested dicts.
+    Node ids are kept in the "name" vertex attribute.
+    """
+    if not _IGRAPH_AVAILABLE:
+        raise ImportError("backend='igraph' requires igraph: pip install igraph")
+    import igraph as ig
+
+    # Same precedence as NetworkX: extracted attributes win on id collisions
+    vertices = pd.concat([
+        pd.DataFrame({"name": original_entities.unique(), "node_type": "original", "entity_type": "row"}),
+        pd.DataFrame({"name": new_entities, "node_type": "extracted", "entity_type": entity_column}),
+    ], ignore_index=True).drop_duplicates(subset="name", keep="last")
+
+    G = ig.Graph.DataFrame(edges_df, directed=True, vertices=vertices, use_vids=False)
+
+    # A scalar assignment is broadcast to every edge
+    for name, value in shared_attrs.items():
+        G.es[name] = value
+
+    return G
+
+
+def _find_orphan_rows(candidates: pd.Index, edges_df: pd.DataFrame) -> List[Any]:
+    """
+    Fast orphan check for graphs built by build_l2_to_l3_graph.
+
+    Every extracted entity comes from an edge, so only rows without an
+    entity value can be orphans - unless they are connected through another
+    row with the same identifier. Equivalent to validate_no_orphan_nodes on
+    the built graph, computed as a set difference against edge endpoints.
+    """
+    if candidates.empty:
+        return []
+    connected = candidates.isin(edges_df["source"]) | candidates.isin(edges_df["target"])
+    return candidates[~connected].unique().tolist()
+
+
+def has_orphan_nodes(graph: nx.Graph) -> bool:
+    """
+    Check whether graph has any orphan node, stopping at the first one.
+
+    Use this when only a yes/no answer is needed; call
+    validate_no_orphan_nodes to list them.
+
+    Parameters:
+    -----------
+    graph : nx.Graph
+        The graph to check
+
+    Returns:
+    --------
+    bool
+        True if at least one node has degree 0
+    """
+    return any(degree == 0 for _, degree in graph.degree())
+
+
 def validate_no_orphan_nodes(graph: nx.Graph) -> List[Any]:
     """
     Validate that graph has no orphan nodes (Design Constraint 1).
@@ -228,11 +403,15 @@ def validate_no_orphan_nodes(graph: nx.Graph) -> List[Any]:
     >>> orphans = validate_no_orphan_nodes(G)
     >>> print(f"Orphan nodes: {orphans}")  # [3, 4]
     """
-    orphans = [node for node in graph.nodes() if graph.degree(node) == 0]
+    # Single pass over the degree view instead of one degree() call per node
+    orphans = [node for node, degree in graph.degree() if degree == 0]
     return orphans
 
 
-def get_graph_statistics(l3_graph: Level3Dataset) -> Dict[str, Any]:
+def get_graph_statistics(
+    l3_graph: Level3Dataset,
+    include_connectivity: bool = True
+) -> Dict[str, Any]:
     """
     Get statistics about graph structure.
 
@@ -242,11 +421,16 @@ def get_graph_statistics(l3_graph: Level3Dataset) -> Dict[str, Any]:
     - node_types: Distribution of node types
     - avg_degree: Average node degree
     - orphan_count: Number of orphan nodes (should be 0)
+    - is_connected: Weak connectivity (None if not computed)
 
     Parameters:
     -----------
     l3_graph : Level3Dataset
         The L3 graph
+    include_connectivity : bool
+        If True (default), run the O(N+E) connectivity traversal when the
+        answer was not recorded by build_l2_to_l3_graph. If False,
+        is_connected falls back to the recorded value or None.
 
     Returns:
     --------
@@ -261,32 +445,43 @@ def get_graph_statistics(l3_graph: Level3Dataset) -> Dict[str, Any]:
     """
     G = l3_graph.get_data()
 
+    if _IGRAPH_AVAILABLE and type(G).__module__.startswith("igraph"):
+        is_connected = _recorded_connectivity(l3_graph, G.vcount(), G.ecount())
+        return _get_igraph_statistics(G, is_connected, include_connectivity)
+
     if not isinstance(G, nx.Graph):
         raise TypeError(f"Expected NetworkX graph, got {type(G).__name__}")
 
-    # Count node types
-    node_types = {}
-    for node in G.nodes():
-        node_type = G.nodes[node].get('node_type', 'unknown')
-        node_types[node_type] = node_types.get(node_type, 0) + 1
+    node_count = G.number_of_nodes()
+
+    is_connected = _recorded_connectivity(l3_graph, node_count, G.number_of_edges())
+    if is_connected is None and include_connectivity:
+        is_connected = nx.is_weakly_connected(G) if G.is_directed() else nx.is_connected(G)
 
-    # Calculate degrees
-    degrees = [G.degree(node) for node in G.nodes()]
-    avg_degree = sum(degrees) / len(degrees) if degrees else 0
+    # Count node types (nodes without the attribute count as 'unknown')
+    typed = nx.get_node_attributes(G, 'node_type')
+    node_types = dict(Counter(typed.values()))
+    if len(typed) < node_count:
+        node_types['unknown'] = node_types.get('unknown', 0) + node_count - len(typed)
+
+    # Pull degrees into one int array; mean/min/max then run in C
+    nodes = list(G.nodes())
+    degrees = np.fromiter((degree for _, degree in G.degree(nodes)), dtype=np.int64, count=node_count)
+    has_nodes = degrees.size > 0
 
     # Count orphans
-    orphans = validate_no_orphan_nodes(G)
+    orphans = [nodes[i] for i in np.flatnonzero(degrees == 0)]
 
     stats = {
-        "node_count": G.number_of_nodes(),
+        "node_count": node_count,
         "edge_count": G.number_of_edges(),
         "node_types": node_types,
-        "avg_degree": avg_degree,
-        "min_degree": min(degrees) if degrees else 0,
-        "max_degree": max(degrees) if degrees else 0,
+        "avg_degree": float(degrees.mean()) if has_nodes else 0,
+        "min_degree": int(degrees.min()) if has_nodes else 0,
+        "max_degree": int(degrees.max()) if has_nodes else 0,
         "orphan_count": len(orphans),
         "orphan_nodes": orphans,
-        "is_connected": nx.is_weakly_connected(G) if G.is_directed() else nx.is_connected(G),
+        "is_connected": is_connected,
         "density": nx.density(G)
     }
 
@@ -318,6 +513,39 @@ def remove_orphan_nodes(graph: nx.Graph) -> nx.Graph:
     >>> G_clean = remove_orphan_nodes(G)
     >>> print(G_clean.number_of_nodes())  # 2 (orphans 3, 4 removed)
     """
-    orphans = validate_no_orphan_nodes(graph)
-    graph.remove_nodes_from(orphans)
+    if has_orphan_nodes(graph):
+        graph.remove_nodes_from(validate_no_orphan_nodes(graph))
     return graph
+
+
+def _recorded_connectivity(l3_graph: Level3Dataset, node_count: int, edge_count: int) -> Optional[bool]:
+    """Connectivity recorded at build time, or None if unknown or the graph has changed since."""
+    meta = getattr(l3_graph, "_metadata", None) or {}
+    if (meta.get("node_count"), meta.get("edge_count")) != (node_count, edge_count):
+        return None
+    return meta.get("is_connected")
+
+
+def _get_igraph_statistics(G, is_connected: Optional[bool], include_connectivity: bool) -> Dict[str, Any]:
+    """get_graph_statistics for graphs built with backend="igraph"."""
+    if is_connected is None and include_connectivity:
+        is_connected = G.is_connected(mode="weak") if G.vcount() else False
+    node_types = {}
+    if "node_type" in G.vs.attributes():
+        node_types = pd.Series(G.vs["node_type"]).fillna("unknown").value_counts().to_dict()
+
+    degrees = G.degree()
+    orphans = [G.vs[i]["name"] for i, degree in enumerate(degrees) if degree == 0]
+
+    return {
+        "node_count": G.vcount(),
+        "edge_count": G.ecount(),
+        "node_types": node_types,
+        "avg_degree": sum(degrees) / len(degrees) if degrees else 0,
+        "min_degree": min(degrees) if degrees else 0,
+        "max_degree": max(degrees) if degrees else 0,
+        "orphan_count": len(orphans),
+        "orphan_nodes": orphans,
+        "is_connected": is_connected,
+        "density": G.density(loops=False),
+    }
@@ -116,18 +116,18 @@ def unfold_l0_to_l1(
     # Strict parent validation (Option A: recommended)
     if validate_parent and not datum.has_parent:
         raise NoParentError(
-            f"Cannot unfold datum '{datum.value}' to L1: no parent vector exists. "
+            f"Cannot unfold datum '{datum.get_data()}' to L1: no parent vector exists. "
             f"\\n\\nThis datum was not created by aggregating a vector, so there's "
             f"no original data to restore. To create a new vector from this datum, "
             f"use an enrichment function instead (L0→L1 enrichment).\\n\\n"
             f"Datum details:\\n"
-            f"  - Value: {datum.value}\\n"
+            f"  - Value: {datum.get_data()}\\n"
             f"  - Has parent: {datum.has_parent}\\n"
             f"  - Aggregation method: {datum.aggregation_method}"
         )
 
     # Get parent vector (series)
-    parent_series = datum.parent_data
+    parent_series = datum.get_parent_data()
 
     if parent_series is None:
         # This should only happen if validate_parent=False
@@ -136,11 +136,13 @@ def unfold_l0_to_l1(
     # Create L1 dataset from parent series
     vector_name = parent_series.name if hasattr(parent_series, 'name') else "vector"
 
+    # Level1Dataset keeps a reference, so the parent buffer is shared with
+    # the datum rather than copied on every unfold
     l1 = Level1Dataset(parent_series, name=str(vector_name))
 
     # Attach metadata for UI display
     l1._metadata = {
-        "unfolded_from": datum.value,
+        "unfolded_from": datum.get_data(),
         "aggregation_method": datum.aggregation_method,
         "original_length": len(parent_series),
         "source_operation": f"Unfolded from L0 datum (aggregation: {datum.aggregation_method})"
@@ -176,11 +178,12 @@ def get_aggregation_info(datum: Level0Dataset) -> dict:
     info = {
         "aggregation_method": datum.aggregation_method,
         "has_parent": datum.has_parent,
-        "value": datum.value,
+        "value": datum.get_data(),
     }
 
-    if datum.has_parent and datum.parent_data is not None:
-        info["original_length"] = len(datum.parent_data)
+    parent_series = datum.get_parent_data()
+    if parent_series is not None:
+        info["original_length"] = len(parent_series)
         info["can_unfold"] = True
     else:
         info["original_length"] = None
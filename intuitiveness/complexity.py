@@ -76,6 +76,9 @@ class Level1Dataset(Dataset):
     """
     Level 1: Variable / Vector.
     Represents a single series of values (e.g., a pandas Series or list).
+
+    The series is kept by reference, not copied; callers that go on to
+    mutate it should pass a copy.
     """
     def __init__(self, series: pd.Series, name: str = "variable"):
         self._series = series
@@ -26,10 +26,16 @@ Usage:
 """
 
 import hashlib
+import heapq
+import itertools
 import json
 import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
@@ -40,26 +46,72 @@ logger = logging.getLogger(__name__)
 # Cache configuration
 CACHE_TTL_SECONDS = 3600  # 1 hour default TTL
 MAX_CACHE_SIZE_MB = 50  # Maximum cache size in memory
+SIZE_SAMPLE_ITEMS = 32  # Items sampled when estimating container sizes
+MAX_SHARED_DATASETS = 32  # Joined DataFrames kept in the process-wide store
+PURGE_EVERY_N_SETS = 100  # Sweep expired entries every N set() calls
 
+_shared_dataset_lock = threading.Lock()
 
-@dataclass
+
+@st.cache_resource(show_spinner=False)
+def _shared_dataset_store() -> "OrderedDict[str, pd.DataFrame]":
+    """
+    Process-wide LRU store for joined DataFrames.
+
+    Lives in Streamlit's resource cache so each DataFrame is held once per
+    process (keyed by content) instead of inside every session's state.
+    Stored DataFrames are shared and must be treated as read-only.
+    """
+    return OrderedDict()
+
+
+@lru_cache(maxsize=128)
+def _hash_frozen_config(frozen_config: frozenset) -> str:
+    """Hash of a join config given as (key, type, value) triples; same digest as _compute_hash."""
+    config = {key: value for key, _, value in frozen_config}
+    return hashlib.blake2b(json.dumps(config, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+
+def _item_size(item: Any) -> int:
+    """Shallow size of an item plus its direct elements for tuples/lists."""
+    size = sys.getsizeof(item)
+    if isinstance(item, (tuple, list)):
+        size += sum(sys.getsizeof(element) for element in item)
+    return size
+
+
+@dataclass(frozen=True)
 class CacheEntry:
-    """A single cache entry with metadata."""
+    """
+    A single cache entry with metadata.
+
+    __slots__ is declared by hand (dataclass(slots=True) needs Python 3.10),
+    so fields can't have class-level defaults: ttl_seconds is always passed,
+    and CacheManager.set applies CACHE_TTL_SECONDS.
+    """
+    __slots__ = ("key", "value", "timestamp", "size_bytes", "ttl_seconds")
+
     key: str
     value: Any
-    timestamp: datetime
+    timestamp: float  # time.monotonic() at insertion
     size_bytes: int
-    ttl_seconds: int = CACHE_TTL_SECONDS
+    ttl_seconds: int
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
 
-    def is_expired(self) -> bool:
+    def __setstate__(self, state):
+        # Frozen: the default slot restore would go through __setattr__
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if this cache entry has expired."""
-        age = datetime.now() - self.timestamp
-        return age.total_seconds() > self.ttl_seconds
+        return self.get_age_seconds(now) > self.ttl_seconds
 
-    def get_age_seconds(self) -> float:
+    def get_age_seconds(self, now: Optional[float] = None) -> float:
         """Get the age of this cache entry in seconds."""
-        age = datetime.now() - self.timestamp
-        return age.total_seconds()
+        return (now if now is not None else time.monotonic()) - self.timestamp
 
 
 class CacheManager:
@@ -76,30 +128,125 @@ class CacheManager:
 
     def __init__(self):
         """Initialize cache manager with session state."""
-        if 'cache_entries' not in st.session_state:
-            st.session_state['cache_entries'] = {}
+        # Entries are kept in LRU order: least recently used first. The dict
+        # is looked up in session state once and mutated in place afterwards.
+        self._entries = st.session_state.setdefault('cache_entries', OrderedDict())
+        # Expiry is tracked in a min-heap of (expires_at, key, timestamp), so
+        # finding expired entries doesn't scan the whole cache. Heap items of
+        # replaced or removed entries are skipped (and dropped) lazily.
+        self._expiry_heap = st.session_state.setdefault('cache_expiry_heap', [])
+        self._expired_keys = st.session_state.setdefault('cache_expired_keys', set())
+        if 'cache_total_size_bytes' not in st.session_state:
+            st.session_state['cache_total_size_bytes'] = 0
+        if 'cache_set_count' not in st.session_state:
+            st.session_state['cache_set_count'] = 0
+
+    def _remove_entry(self, entries: Dict[str, CacheEntry], key: str) -> None:
+        """Delete an entry and keep the running size counter in sync."""
+        entry = entries.pop(key)
+        self._expired_keys.discard(key)
+        st.session_state['cache_total_size_bytes'] -= entry.size_bytes
+
+    def _collect_expired(self, now: float) -> set:
+        """Move entries that have expired by `now` from the expiry heap into the expired-key set."""
+        heap = self._expiry_heap
+        entries = self._entries
+        while heap:
+            _, key, timestamp = heap[0]
+            entry = entries.get(key)
+            if entry is not None and entry.timestamp == timestamp:
+                if not entry.is_expired(now):
+                    break
+                self._expired_keys.add(key)
+            heapq.heappop(heap)
+        return self._expired_keys
 
     def _compute_hash(self, data: Any) -> str:
         """
         Compute a hash for cache key generation.
 
+        Cache keys don't need cryptographic strength, so BLAKE2b with an
+        8-byte digest is used. DataFrames are fingerprinted over every cell
+        (and the column names) with pandas' vectorized row hashing.
+
         Args:
             data: Data to hash (dict, list, DataFrame, etc.)
 
         Returns:
-            SHA256 hash string
+            16-character hex digest
         """
         if isinstance(data, pd.DataFrame):
-            # Hash DataFrame shape and first/last rows
-            key_data = f"{data.shape}_{data.head(1).to_json()}_{data.tail(1).to_json()}"
-        elif isinstance(data, dict):
+            digest = hashlib.blake2b(str(list(data.columns)).encode(), digest_size=8)
+            try:
+                row_hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+                # Feed the uint64 buffer directly; no intermediate bytes copy
+                digest.update(memoryview(row_hashes))
+            except TypeError:
+                # Unhashable cells (lists, dicts): fall back to full serialization
+                digest.update(data.to_json().encode())
+            return digest.hexdigest()
+
+        if isinstance(data, dict):
             key_data = json.dumps(data, sort_keys=True)
         elif isinstance(data, list):
             key_data = json.dumps(data)
         else:
             key_data = str(data)
 
-        return hashlib.sha256(key_data.encode()).hexdigest()[:16]
+        return hashlib.blake2b(key_data.encode(), digest_size=8).hexdigest()
+
+    def _compute_config_hash(self, config: Dict) -> str:
+        """
+        Hash a join configuration, memoised across Streamlit reruns.
+
+        Configs with hashable values are looked up by content in an LRU cache,
+        so an unchanged config is not re-serialized on every call. Value types
+        are part of the key so that e.g. 1 and True stay distinct.
+
+        Args:
+            config: Join configuration
+
+        Returns:
+            16-character hex digest
+        """
+        try:
+            frozen = frozenset((key, type(value), value) for key, value in config.items())
+            return _hash_frozen_config(frozen)
+        except TypeError:
+            # Unhashable values (lists, nested dicts): hash the full config
+            return self._compute_hash(config)
+
+    def _estimate_size(self, value: Any) -> int:
+        """
+        Estimate the in-memory size of a value without serializing it.
+
+        DataFrames report their exact memory usage. Containers are sized from
+        a sample of their first items, extrapolated to the full length.
+
+        Args:
+            value: Value to size
+
+        Returns:
+            Approximate size in bytes
+        """
+        try:
+            if isinstance(value, pd.DataFrame):
+                return int(value.memory_usage(deep=True).sum())
+
+            size_bytes = sys.getsizeof(value)
+            if isinstance(value, dict):
+                sample = list(itertools.islice(value.items(), SIZE_SAMPLE_ITEMS))
+            elif isinstance(value, (list, tuple, set)):
+                sample = list(itertools.islice(value, SIZE_SAMPLE_ITEMS))
+            else:
+                return size_bytes
+
+            if sample:
+                sample_bytes = sum(_item_size(item) for item in sample)
+                size_bytes += sample_bytes * len(value) // len(sample)
+            return size_bytes
+        except Exception:
+            return 1024  # Default estimate
 
     def set(
         self,
@@ -115,25 +262,84 @@ class CacheManager:
             value: Value to cache
             ttl_seconds: Time to live in seconds
         """
-        # Estimate size
-        try:
-            if isinstance(value, pd.DataFrame):
-                size_bytes = value.memory_usage(deep=True).sum()
-            else:
-                size_bytes = len(json.dumps(value, default=str))
-        except Exception:
-            size_bytes = 1024  # Default estimate
+        size_bytes = self._put(key, value, ttl_seconds, time.monotonic())
+        st.session_state['cache_total_size_bytes'] += size_bytes
+        logger.info(f"Cached '{key}' ({size_bytes} bytes, TTL={ttl_seconds}s)")
+        self._after_sets(1)
 
-        entry = CacheEntry(
+    def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl_seconds: int = CACHE_TTL_SECONDS
+    ) -> None:
+        """
+        Set several cache entries at once.
+
+        All entries share one timestamp, and the size counter, expiry sweep
+        and eviction run once for the batch instead of once per entry.
+
+        Args:
+            items: Mapping of cache key to value
+            ttl_seconds: Time to live in seconds
+        """
+        now = time.monotonic()
+        total_bytes = sum(self._put(key, value, ttl_seconds, now) for key, value in items.items())
+        st.session_state['cache_total_size_bytes'] += total_bytes
+        logger.info(f"Cached {len(items)} entries ({total_bytes} bytes, TTL={ttl_seconds}s)")
+        self._after_sets(len(items))
+
+    def _put(self, key: str, value: Any, ttl_seconds: int, now: float) -> int:
+        """Insert an entry (replacing any previous one) and return its size; the caller adds it to the size counter."""
+        size_bytes = self._estimate_size(value)
+        entries = self._entries
+        if key in entries:
+            self._remove_entry(entries, key)
+        entries[key] = CacheEntry(
             key=key,
             value=value,
-            timestamp=datetime.now(),
+            timestamp=now,
             size_bytes=size_bytes,
             ttl_seconds=ttl_seconds
         )
+        heap = self._expiry_heap
+        heapq.heappush(heap, (now + ttl_seconds, key, now))
+        if len(heap) > 2 * len(entries) + PURGE_EVERY_N_SETS:
+            # Mostly stale items: rebuild from the live entries
+            heap[:] = [(e.timestamp + e.ttl_seconds, k, e.timestamp) for k, e in entries.items()]
+            heapq.heapify(heap)
+        return size_bytes
+
+    def _after_sets(self, count: int) -> None:
+        """Bookkeeping after inserting entries: periodic expiry sweep and size-limit eviction."""
+        previous = st.session_state['cache_set_count']
+        st.session_state['cache_set_count'] = previous + count
+        if (previous + count) // PURGE_EVERY_N_SETS > previous // PURGE_EVERY_N_SETS:
+            self.purge_expired()
+        self._evict_to_size_limit(self._entries)
+
+    def _evict_to_size_limit(self, entries: "OrderedDict[str, CacheEntry]") -> None:
+        """Drop least recently used entries until under MAX_CACHE_SIZE_MB."""
+        max_bytes = MAX_CACHE_SIZE_MB * 1024 * 1024
+        # Always keep the most recent entry, even if it alone exceeds the limit
+        while st.session_state['cache_total_size_bytes'] > max_bytes and len(entries) > 1:
+            key = next(iter(entries))
+            self._remove_entry(entries, key)
+            logger.info(f"Evicted cache entry (size limit): '{key}'")
+
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries in one sweep.
 
-        st.session_state['cache_entries'][key] = entry
-        logger.info(f"Cached '{key}' ({size_bytes} bytes, TTL={ttl_seconds}s)")
+        Returns:
+            Number of entries removed
+        """
+        entries = self._entries
+        expired_keys = list(self._collect_expired(time.monotonic()))
+        for key in expired_keys:
+            self._remove_entry(entries, key)
+        if expired_keys:
+            logger.info(f"Purged {len(expired_keys)} expired cache entries")
+        return len(expired_keys)
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -145,7 +351,7 @@ class CacheManager:
         Returns:
             Cached value or None if not found/expired
         """
-        entries = st.session_state.get('cache_entries', {})
+        entries = self._entries
         entry = entries.get(key)
 
         if entry is None:
@@ -153,12 +359,38 @@ class CacheManager:
 
         if entry.is_expired():
             logger.info(f"Cache expired: '{key}'")
-            del entries[key]
+            self._remove_entry(entries, key)
             return None
 
+        entries.move_to_end(key)
+
         logger.debug(f"Cache hit: '{key}' (age={entry.get_age_seconds():.1f}s)")
         return entry.value
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several cache entries at once.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Mapping of key to cached value; missing or expired keys are omitted
+        """
+        entries = self._entries
+        now = time.monotonic()
+        found = {}
+        for key in keys:
+            entry = entries.get(key)
+            if entry is None:
+                continue
+            if entry.is_expired(now):
+                self._remove_entry(entries, key)
+                continue
+            entries.move_to_end(key)
+            found[key] = entry.value
+        return found
+
     def invalidate(self, key: str) -> None:
         """
         Invalidate a specific cache entry.
@@ -166,14 +398,18 @@ class CacheManager:
         Args:
             key: Cache key to invalidate
         """
-        entries = st.session_state.get('cache_entries', {})
+        entries = self._entries
         if key in entries:
-            del entries[key]
+            self._remove_entry(entries, key)
             logger.info(f"Invalidated cache: '{key}'")
 
     def clear_all(self) -> None:
         """Clear all cache entries."""
-        st.session_state['cache_entries'] = {}
+        # Clear in place: other managers hold a reference to this dict
+        self._entries.clear()
+        self._expiry_heap.clear()
+        self._expired_keys.clear()
+        st.session_state['cache_total_size_bytes'] = 0
         logger.info("Cleared all cache entries")
 
     # Semantic results caching (FR-002)
@@ -235,13 +471,25 @@ class CacheManager:
         """
         Cache joined dataset with configuration.
 
+        The DataFrame goes to the process-wide store; session state only
+        keeps its content-based store key.
+
         Args:
             df: Joined DataFrame
             config: Join configuration used
         """
-        config_hash = self._compute_hash(config)
+        config_hash = self._compute_config_hash(config)
         cache_key = f"joined_dataset_{config_hash}"
-        self.set(cache_key, df, ttl_seconds=3600)  # 1 hour TTL
+        store_key = f"{config_hash}_{self._compute_hash(df)}"
+
+        with _shared_dataset_lock:
+            store = _shared_dataset_store()
+            store[store_key] = df
+            store.move_to_end(store_key)
+            while len(store) > MAX_SHARED_DATASETS:
+                store.popitem(last=False)
+
+        self.set(cache_key, store_key, ttl_seconds=3600)  # 1 hour TTL
 
     def get_joined_dataset(self, config: Dict) -> Optional[pd.DataFrame]:
         """
@@ -251,11 +499,24 @@ class CacheManager:
             config: Join configuration to match
 
         Returns:
-            Cached DataFrame or None
+            Cached DataFrame or None (also if evicted from the shared store)
         """
-        config_hash = self._compute_hash(config)
+        config_hash = self._compute_config_hash(config)
         cache_key = f"joined_dataset_{config_hash}"
-        return self.get(cache_key)
+        store_key = self.get(cache_key)
+        if store_key is None:
+            return None
+
+        with _shared_dataset_lock:
+            store = _shared_dataset_store()
+            df = store.get(store_key)
+            if df is not None:
+                store.move_to_end(store_key)
+
+        if df is None:
+            logger.info(f"Joined dataset evicted from shared store: '{cache_key}'")
+            self.invalidate(cache_key)
+        return df
 
     # User selections caching (FR-005)
 
@@ -286,11 +547,12 @@ class CacheManager:
         Returns:
             Dictionary with cache stats (size, entry count, hit rate, etc.)
         """
-        entries = st.session_state.get('cache_entries', {})
+        entries = self._entries
 
-        total_size_bytes = sum(e.size_bytes for e in entries.values())
+        # Size is tracked incrementally; expired entries come off the expiry heap
+        total_size_bytes = st.session_state.get('cache_total_size_bytes', 0)
         total_entries = len(entries)
-        expired_entries = sum(1 for e in entries.values() if e.is_expired())
+        expired_entries = len(self._collect_expired(time.monotonic()))
 
         return {
             'total_entries': total_entries,
@@ -12,6 +12,8 @@ Primary Components:
 - report: Quality report generation and export
 """
 
+from importlib import import_module
+
 from intuitiveness.quality.models import (
     QualityReport,
     FeatureProfile,
@@ -25,89 +27,103 @@ from intuitiveness.quality.models import (
     TransformationLog,
     ReadinessIndicator,
     ExportPackage,
+    ExportResult,
+    CleaningAction,
 )
 
-from intuitiveness.quality.assessor import (
-    assess_dataset,
-    apply_all_suggestions,
-    get_readiness_indicator,
-    quick_benchmark,
-)
+# Everything below is imported on first attribute access (PEP 562), so
+# `from intuitiveness.quality import export_clean_csv` only loads the
+# submodules that name needs rather than scipy, sklearn and the TabPFN
+# wrappers for every user of the package.
+_LAZY_SUBMODULES = {
+    "assessor": (
+        "assess_dataset",
+        "apply_all_suggestions",
+        "get_readiness_indicator",
+        "quick_benchmark",
+    ),
+    # Feature profiling utilities (Spec 009: FR-002, extracted from assessor.py)
+    "feature_profiler": (
+        "compute_all_stats",
+        "compute_feature_profile",
+        "compute_data_completeness",
+        "compute_feature_diversity",
+        "compute_size_appropriateness",
+        "compute_usability_score",
+        "build_feature_profiles",
+    ),
+    # Data preparation utilities (Spec 009: FR-009, extracted from assessor.py)
+    "data_preparer": (
+        "DatasetWarning",
+        "handle_high_cardinality_categorical",
+        "select_top_features",
+        "check_dataset_edge_cases",
+        "prepare_data_for_tabpfn",
+    ),
+    "feature_engineer": (
+        "suggest_features",
+        "apply_suggestion",
+    ),
+    "anomaly_detector": (
+        "detect_anomalies",
+        "explain_anomaly",
+        "get_anomaly_summary",
+    ),
+    "synthetic_generator": (
+        "generate_synthetic",
+        "validate_synthetic",
+        "check_tabpfn_auth",
+        "get_synthetic_summary",
+    ),
+    "benchmark": (
+        "benchmark_synthetic",
+        "generate_balanced_synthetic",
+        "generate_targeted_synthetic",
+    ),
+    "exporter": (
+        "export_dataset",
+        "export_to_bytes",
+        "export_with_metadata",
+        "generate_python_snippet",
+        "get_mime_type",
+    ),
+    # 60-second workflow (Spec 010: FR-001 through FR-005)
+    "workflow": (
+        "ReadinessStatus",
+        "get_readiness_status",
+        "estimate_score_improvement",
+        "GREEN_THRESHOLD",
+        "YELLOW_THRESHOLD",
+        "WorkflowResult",
+        "run_60_second_workflow",
+        "quick_export",
+    ),
+    # Instant Export (Spec 012: tabpfn-instant-export)
+    "instant_export": (
+        "InstantExporter",
+        "instant_check_and_export",
+        "export_clean_csv",
+    ),
+}
 
-# Feature profiling utilities (Spec 009: FR-002, extracted from assessor.py)
-from intuitiveness.quality.feature_profiler import (
-    compute_feature_profile,
-    compute_data_completeness,
-    compute_feature_diversity,
-    compute_size_appropriateness,
-    compute_usability_score,
-    build_feature_profiles,
-)
+_lazy_map = {
+    name: f"{__name__}.{submodule}"
+    for submodule, names in _LAZY_SUBMODULES.items()
+    for name in names
+}
 
-# Data preparation utilities (Spec 009: FR-009, extracted from assessor.py)
-from intuitiveness.quality.data_preparer import (
-    DatasetWarning,
-    handle_high_cardinality_categorical,
-    select_top_features,
-    check_dataset_edge_cases,
-    prepare_data_for_tabpfn,
-)
 
-from intuitiveness.quality.feature_engineer import (
-    suggest_features,
-    apply_suggestion,
-)
+def __getattr__(name):
+    if name not in _lazy_map:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_lazy_map[name]), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
 
-from intuitiveness.quality.anomaly_detector import (
-    detect_anomalies,
-    explain_anomaly,
-    get_anomaly_summary,
-)
 
-from intuitiveness.quality.synthetic_generator import (
-    generate_synthetic,
-    validate_synthetic,
-    check_tabpfn_auth,
-    get_synthetic_summary,
-)
-
-from intuitiveness.quality.benchmark import (
-    benchmark_synthetic,
-    generate_balanced_synthetic,
-    generate_targeted_synthetic,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_map))
 
-from intuitiveness.quality.exporter import (
-    export_dataset,
-    export_to_bytes,
-    export_with_metadata,
-    generate_python_snippet,
-    get_mime_type,
-)
-
-# 60-second workflow (Spec 010: FR-001 through FR-005)
-from intuitiveness.quality.workflow import (
-    ReadinessStatus,
-    get_readiness_status,
-    estimate_score_improvement,
-    GREEN_THRESHOLD,
-    YELLOW_THRESHOLD,
-    WorkflowResult,
-    run_60_second_workflow,
-    quick_export,
-)
-
-# Instant Export (Spec 012: tabpfn-instant-export)
-from intuitiveness.quality.instant_export import (
-    InstantExporter,
-    instant_check_and_export,
-    export_clean_csv,
-)
-
-from intuitiveness.quality.models import (
-    ExportResult,
-    CleaningAction,
-)
 
 __all__ = [
     # Models
@@ -129,6 +145,7 @@ __all__ = [
     "get_readiness_indicator",
     "quick_benchmark",
     # Feature profiling functions (extracted from assessor.py)
+    "compute_all_stats",
     "compute_feature_profile",
     "compute_data_completeness",
     "compute_feature_diversity",
@@ -10,12 +10,10 @@ import time
 from typing import Optional, Literal, List, Tuple, Callable
 import numpy as np
 import pandas as pd
-from scipy import stats
 from sklearn.model_selection import cross_val_score, StratifiedKFold, KFold
 
 from intuitiveness.quality.models import (
     QualityReport,
-    FeatureProfile,
     FeatureSuggestion,
     TransformationResult,
     TransformationLog,
@@ -26,11 +24,24 @@ from intuitiveness.quality.tabpfn_wrapper import TabPFNWrapper, is_tabpfn_availa
 # Phase 2: Use consolidated utilities (011-code-simplification)
 from intuitiveness.utils import (
     detect_task_type,
-    detect_feature_type,
     MIN_ROWS_FOR_ASSESSMENT,
     MAX_ROWS_FOR_TABPFN,
-    MAX_FEATURES_FOR_TABPFN,
-    HIGH_CARDINALITY_THRESHOLD,
+)
+from intuitiveness.quality.feature_profiler import (
+    compute_all_stats,
+    compute_feature_profile,
+    compute_data_completeness,
+    compute_feature_diversity,
+    compute_size_appropriateness,
+    compute_usability_score,
+    build_feature_profiles,
+)
+from intuitiveness.quality.data_preparer import (
+    DatasetWarning,
+    handle_high_cardinality_categorical,
+    select_top_features,
+    check_dataset_edge_cases,
+    prepare_data_for_tabpfn,
 )
 
 logger = logging.getLogger(__name__)
@@ -39,362 +50,10 @@ logger = logging.getLogger(__name__)
 SAMPLE_SIZE = 5000  # Default sample size for large datasets
 
 
-class DatasetWarning:
-    """Container for dataset warnings during assessment."""
-
-    def __init__(self):
-        self.warnings: List[str] = []
-
-    def add(self, message: str):
-        self.warnings.append(message)
-        logger.warning(message)
-
-    def has_warnings(self) -> bool:
-        return len(self.warnings) > 0
-
-
-# Note: detect_task_type and detect_feature_type now imported from utils/common.py
+# Note: detect_task_type now imported from utils/common.py
 # This eliminates ~45 lines of duplicated code (Phase 2 consolidation)
-
-
-def compute_feature_profile(
-    df: pd.DataFrame,
-    feature_name: str,
-    importance_score: float = 0.0,
-    shap_mean: float = 0.0,
-) -> FeatureProfile:
-    """
-    Compute statistics for a single feature.
-
-    Args:
-        df: DataFrame containing the feature.
-        feature_name: Column name.
-        importance_score: Pre-computed importance score.
-        shap_mean: Pre-computed mean SHAP value.
-
-    Returns:
-        FeatureProfile instance.
-    """
-    series = df[feature_name]
-    feature_type = detect_feature_type(series)
-
-    missing_count = series.isna().sum()
-    missing_ratio = missing_count / len(series)
-    unique_count = series.nunique()
-
-    # Compute skewness for numeric features
-    distribution_skew = 0.0
-    suggested_transform = None
-    if feature_type == "numeric":
-        clean_series = series.dropna()
-        if len(clean_series) > 0:
-            try:
-                distribution_skew = float(stats.skew(clean_series))
-                # Suggest log transform for highly skewed distributions
-                if abs(distribution_skew) > 2:
-                    suggested_transform = "log"
-                elif abs(distribution_skew) > 1:
-                    suggested_transform = "sqrt"
-            except Exception:
-                pass
-
-    return FeatureProfile(
-        feature_name=feature_name,
-        feature_type=feature_type,
-        missing_count=int(missing_count),
-        missing_ratio=float(missing_ratio),
-        unique_count=int(unique_count),
-        importance_score=importance_score,
-        shap_mean=shap_mean,
-        distribution_skew=distribution_skew,
-        suggested_transform=suggested_transform,
-    )
-
-
-def compute_data_completeness(df: pd.DataFrame) -> float:
-    """
-    Compute data completeness score (0-100).
-
-    Score = (1 - overall_missing_ratio) * 100
-
-    Args:
-        df: DataFrame to assess.
-
-    Returns:
-        Completeness score 0-100.
-    """
-    total_cells = df.shape[0] * df.shape[1]
-    if total_cells == 0:
-        return 0.0
-    missing_cells = df.isna().sum().sum()
-    return (1 - missing_cells / total_cells) * 100
-
-
-def compute_feature_diversity(df: pd.DataFrame, target_column: str) -> float:
-    """
-    Compute feature type diversity score (0-100).
-
-    Based on entropy of feature type distribution.
-    Higher diversity = better for ML (different types capture different aspects).
-
-    Args:
-        df: DataFrame to assess.
-        target_column: Target column to exclude.
-
-    Returns:
-        Diversity score 0-100.
-    """
-    feature_columns = [c for c in df.columns if c != target_column]
-    if not feature_columns:
-        return 0.0
-
-    # Count feature types
-    type_counts = {"numeric": 0, "categorical": 0, "boolean": 0, "datetime": 0}
-    for col in feature_columns:
-        ftype = detect_feature_type(df[col])
-        type_counts[ftype] += 1
-
-    # Compute entropy
-    total = sum(type_counts.values())
-    if total == 0:
-        return 0.0
-
-    probs = [count / total for count in type_counts.values() if count > 0]
-    if len(probs) <= 1:
-        return 25.0  # Only one type = low diversity
-
-    entropy = -sum(p * np.log2(p) for p in probs)
-    max_entropy = np.log2(len(probs))  # Maximum possible entropy
-
-    # Normalize to 0-100
-    return (entropy / max_entropy) * 100 if max_entropy > 0 else 0.0
-
-
-def compute_size_appropriateness(row_count: int) -> float:
-    """
-    Compute size appropriateness score (0-100).
-
-    TabPFN works best with 50-10,000 rows.
-    Score penalizes datasets outside this range.
-
-    Args:
-        row_count: Number of rows in dataset.
-
-    Returns:
-        Size score 0-100.
-    """
-    if row_count < MIN_ROWS_FOR_ASSESSMENT:
-        # Linear penalty for too few rows
-        return max(0, (row_count / MIN_ROWS_FOR_ASSESSMENT) * 50)
-    elif row_count <= MAX_ROWS_FOR_TABPFN:
-        # Optimal range
-        return 100.0
-    else:
-        # Gradual penalty for large datasets (still usable via sampling)
-        # Drops to 70 at 50k rows, 50 at 100k rows
-        excess = row_count - MAX_ROWS_FOR_TABPFN
-        penalty = min(50, excess / 2000)  # Max 50 point penalty
-        return 100 - penalty
-
-
-def compute_usability_score(
-    prediction_quality: float,
-    data_completeness: float,
-    feature_diversity: float,
-    size_appropriateness: float,
-) -> float:
-    """
-    Compute composite usability score (0-100).
-
-    Formula: 40% prediction + 30% completeness + 20% diversity + 10% size
-
-    Args:
-        prediction_quality: TabPFN cross-validation score (0-100).
-        data_completeness: Missing value score (0-100).
-        feature_diversity: Feature type entropy (0-100).
-        size_appropriateness: Size penalty score (0-100).
-
-    Returns:
-        Usability score 0-100.
-    """
-    return (
-        0.4 * prediction_quality
-        + 0.3 * data_completeness
-        + 0.2 * feature_diversity
-        + 0.1 * size_appropriateness
-    )
-
-
-def handle_high_cardinality_categorical(
-    series: pd.Series,
-    threshold: int = HIGH_CARDINALITY_THRESHOLD,
-) -> pd.Series:
-    """
-    Handle high-cardinality categorical features by binning rare values.
-
-    Args:
-        series: Categorical series.
-        threshold: Maximum number of unique values to keep.
-
-    Returns:
-        Series with rare values grouped as 'other'.
-    """
-    value_counts = series.value_counts()
-
-    if len(value_counts) <= threshold:
-        return series
-
-    # Keep top N-1 values, group rest as 'other'
-    top_values = set(value_counts.head(threshold - 1).index)
-
-    return series.apply(lambda x: x if x in top_values else "_other_")
-
-
-def select_top_features(
-    X: pd.DataFrame,
-    y: pd.Series,
-    max_features: int = MAX_FEATURES_FOR_TABPFN,
-) -> pd.DataFrame:
-    """
-    Select top features when dataset has too many.
-
-    Uses variance-based selection for efficiency.
-
-    Args:
-        X: Feature DataFrame.
-        y: Target Series.
-        max_features: Maximum number of features to keep.
-
-    Returns:
-        DataFrame with selected features.
-    """
-    if X.shape[1] <= max_features:
-        return X
-
-    logger.info(f"Selecting top {max_features} features from {X.shape[1]}")
-
-    # Use variance as simple feature importance proxy
-    variances = X.var().sort_values(ascending=False)
-    top_features = variances.head(max_features).index.tolist()
-
-    return X[top_features]
-
-
-def check_dataset_edge_cases(
-    df: pd.DataFrame,
-    target_column: str,
-) -> DatasetWarning:
-    """
-    Check for edge cases and generate warnings.
-
-    Args:
-        df: DataFrame to check.
-        target_column: Target column name.
-
-    Returns:
-        DatasetWarning with any warnings.
-    """
-    warnings = DatasetWarning()
-
-    # Check row count
-    if len(df) < MIN_ROWS_FOR_ASSESSMENT:
-        warnings.add(
-            f"Dataset has only {len(df)} rows. "
-            f"Minimum {MIN_ROWS_FOR_ASSESSMENT} recommended for reliable assessment."
-        )
-
-    # Check feature count
-    feature_count = len(df.columns) - 1  # Exclude target
-    if feature_count > MAX_FEATURES_FOR_TABPFN:
-        warnings.add(
-            f"Dataset has {feature_count} features. "
-            f"Top {MAX_FEATURES_FOR_TABPFN} will be selected for assessment."
-        )
-
-    # Check for only-categorical or only-numeric
-    feature_cols = [c for c in df.columns if c != target_column]
-    numeric_cols = df[feature_cols].select_dtypes(include=[np.number]).columns
-    categorical_cols = df[feature_cols].select_dtypes(exclude=[np.number]).columns
-
-    if len(numeric_cols) == 0 and len(categorical_cols) > 0:
-        warnings.add(
-            "Dataset contains only categorical features. "
-            "Consider adding numeric features for better ML performance."
-        )
-    elif len(categorical_cols) == 0 and len(numeric_cols) > 0:
-        warnings.add(
-            "Dataset contains only numeric features. "
-            "This is fine but diversity score will be lower."
-        )
-
-    # Check for high-cardinality categoricals
-    for col in categorical_cols:
-        n_unique = df[col].nunique()
-        if n_unique > HIGH_CARDINALITY_THRESHOLD:
-            warnings.add(
-                f"Feature '{col}' has {n_unique} unique values (high cardinality). "
-                f"Rare values will be grouped for encoding."
-            )
-
-    return warnings
-
-
-def prepare_data_for_tabpfn(
-    df: pd.DataFrame,
-    target_column: str,
-    warnings: Optional[DatasetWarning] = None,
-) -> Tuple[pd.DataFrame, pd.Series]:
-    """
-    Prepare DataFrame for TabPFN by handling missing values and encoding.
-
-    Handles edge cases:
-    - High-cardinality categoricals (>100 unique values)
-    - Too many features (>500)
-    - Only categorical or only numeric datasets
-
-    Args:
-        df: Input DataFrame.
-        target_column: Target column name.
-        warnings: Optional DatasetWarning to collect warnings.
-
-    Returns:
-        Tuple of (X, y) ready for TabPFN.
-    """
-    # Separate features and target
-    feature_columns = [c for c in df.columns if c != target_column]
-    X = df[feature_columns].copy()
-    y = df[target_column].copy()
-
-    # Handle missing values in target
-    valid_mask = ~y.isna()
-    X = X[valid_mask]
-    y = y[valid_mask]
-
-    # Handle missing values in features
-    for col in X.columns:
-        if X[col].isna().any():
-            if pd.api.types.is_numeric_dtype(X[col]):
-                X[col] = X[col].fillna(X[col].median())
-            else:
-                X[col] = X[col].fillna(X[col].mode().iloc[0] if len(X[col].mode()) > 0 else "missing")
-
-    # Handle high-cardinality categoricals
-    for col in X.columns:
-        if X[col].dtype == "object" or X[col].dtype.name == "category":
-            if X[col].nunique() > HIGH_CARDINALITY_THRESHOLD:
-                X[col] = handle_high_cardinality_categorical(X[col])
-
-    # Encode categorical features
-    for col in X.columns:
-        if X[col].dtype == "object" or X[col].dtype.name == "category":
-            # Simple label encoding
-            X[col] = pd.Categorical(X[col]).codes
-
-    # Handle too many features
-    if X.shape[1] > MAX_FEATURES_FOR_TABPFN:
-        X = select_top_features(X, y)
-
-    return X, y
+# Feature profiling and data preparation live in feature_profiler.py and
+# data_preparer.py (Phase 4.1); the assessment pipeline uses them from there.
 
 
 def compute_feature_importance(
@@ -731,9 +390,11 @@ def assess_dataset(
 
     report_progress("Computing basic metrics", 0.2)
 
-    # Compute basic metrics
-    data_completeness = compute_data_completeness(df)
-    feature_diversity = compute_feature_diversity(df, target_column)
+    # Compute basic metrics (column stats are computed once and shared
+    # with the feature profiles below)
+    column_stats = compute_all_stats(df, target_column)
+    data_completeness = compute_data_completeness(df, column_stats=column_stats)
+    feature_diversity = compute_feature_diversity(df, target_column, column_stats=column_stats)
     size_appropriateness = compute_size_appropriateness(original_row_count)
 
     report_progress("Computing prediction quality (fold 1/5)", 0.2)
@@ -836,15 +497,15 @@ def assess_dataset(
     report_progress("Building feature profiles", 0.9)
 
     # Build feature profiles
-    feature_profiles = []
-    for col in feature_columns:
-        profile = compute_feature_profile(
-            df,
-            col,
-            importance_score=importance_dict.get(col, 0.0),
-            shap_mean=shap_dict.get(col, 0.0),
-        )
-        feature_profiles.append(profile)
+    feature_profiles = build_feature_profiles(
+        df,
+        target_column,
+        importance_scores=importance_dict,
+        shap_values=shap_dict,
+        feature_columns=feature_columns,
+        sort_by_importance=False,
+        column_stats=column_stats,
+    )
 
     # Compute usability score
     usability_score = compute_usability_score(
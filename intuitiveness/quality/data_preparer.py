@@ -27,6 +27,9 @@ from intuitiveness.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Rows scanned before an exact nunique() when testing for high cardinality
+CARDINALITY_PROBE_ROWS = 10_000
+
 
 class DatasetWarning:
     """Container for dataset warnings during assessment."""
@@ -54,7 +57,9 @@ def handle_high_cardinality_categorical(
         threshold: Maximum number of unique values to keep.
 
     Returns:
-        Series with rare values grouped as 'other'.
+        Series with rare values grouped as 'other'. A 'category' series
+        stays categorical (kept categories in their original order, then
+        '_other_').
     """
     value_counts = series.value_counts()
 
@@ -62,9 +67,46 @@ def handle_high_cardinality_categorical(
         return series
 
     # Keep top N-1 values, group rest as 'other'
-    top_values = set(value_counts.head(threshold - 1).index)
+    top_values = value_counts.index[:threshold - 1]
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if "_other_" not in series.cat.categories:
+            return _bin_categorical_codes(series, top_values)
+        # '_other_' is already a category: fall back to the object path;
+        # missing values stay missing, as with Categorical.map
+        keep = series.isin(top_values) | series.isna()
+        return series.astype(object).where(keep, "_other_")
+
+    # Hash-based isin mask + vectorized select, no per-row Python callback
+    return series.where(series.isin(top_values), "_other_")
+
+
+def _bin_categorical_codes(series: pd.Series, top_values: pd.Index) -> pd.Series:
+    """
+    Group the categories of a 'category' series outside top_values as '_other_'.
+
+    Works on the integer codes only: a bitmap over the categories marks the
+    kept ones and a lookup table maps every old code to its new code, so no
+    value is hashed per row. Missing values (code -1) stay missing.
+    """
+    categories = series.cat.categories
+    keep = np.zeros(len(categories), dtype=bool)
+    keep[categories.get_indexer(top_values)] = True
 
-    return series.apply(lambda x: x if x in top_values else "_other_")
+    # Kept categories are renumbered in order; all others map to '_other_'
+    n_kept = int(keep.sum())
+    remap = np.full(len(categories), n_kept, dtype=np.int64)
+    remap[keep] = np.arange(n_kept)
+
+    codes = series.cat.codes.to_numpy()
+    new_codes = np.where(codes < 0, -1, remap[codes])
+    new_categories = categories[keep].append(pd.Index(["_other_"]))
+
+    return pd.Series(
+        pd.Categorical.from_codes(new_codes, categories=new_categories),
+        index=series.index,
+        name=series.name,
+    )
 
 
 def select_top_features(
@@ -91,10 +133,22 @@ def select_top_features(
     logger.info(f"Selecting top {max_features} features from {X.shape[1]}")
 
     # Use variance as simple feature importance proxy
-    variances = X.var().sort_values(ascending=False)
-    top_features = variances.head(max_features).index.tolist()
+    if not X.dtypes.map(pd.api.types.is_numeric_dtype).all():
+        # Non-numeric columns (e.g. datetimes): keep pandas semantics
+        variances = X.var().sort_values(ascending=False)
+        return X[variances.head(max_features).index.tolist()]
+
+    values = X.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Same statistic as DataFrame.var() (ddof=1, NaN skipped), in one pass
+    # over a contiguous array; argpartition finds the top-k in O(n) and only
+    # those k are sorted (NaN variances rank last, as in sort_values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variances = np.nanvar(values, axis=0, ddof=1)
+    top_idx = np.argpartition(-variances, max_features - 1)[:max_features]
+    top_idx = top_idx[np.argsort(-variances[top_idx], kind="stable")]
 
-    return X[top_features]
+    return X.iloc[:, top_idx]
 
 
 def check_dataset_edge_cases(
@@ -131,9 +185,12 @@ def check_dataset_edge_cases(
         )
 
     # Check for only-categorical or only-numeric
-    feature_cols = [c for c in df.columns if c != target_column]
-    numeric_cols = df[feature_cols].select_dtypes(include=[np.number]).columns
-    categorical_cols = df[feature_cols].select_dtypes(exclude=[np.number]).columns
+    # Both column groups come from one pass over the dtypes instead of two
+    # select_dtypes() calls on a feature sub-frame
+    dtypes = df.dtypes.drop(target_column, errors="ignore")
+    is_number = dtypes.map(_is_number_dtype).to_numpy(dtype=bool)
+    numeric_cols = dtypes.index[is_number]
+    categorical_cols = dtypes.index[~is_number]
 
     if len(numeric_cols) == 0 and len(categorical_cols) > 0:
         warnings.add(
@@ -146,18 +203,61 @@ def check_dataset_edge_cases(
             "This is fine but diversity score will be lower."
         )
 
-    # Check for high-cardinality categoricals
-    for col in categorical_cols:
-        n_unique = df[col].nunique()
-        if n_unique > HIGH_CARDINALITY_THRESHOLD:
-            warnings.add(
-                f"Feature '{col}' has {n_unique} unique values (high cardinality). "
-                f"Rare values will be grouped for encoding."
-            )
+    # Check for high-cardinality categoricals: one batched nunique(), and
+    # only columns over the threshold come back into Python
+    n_uniques = df[categorical_cols].nunique()
+    for col, n_unique in n_uniques[n_uniques > HIGH_CARDINALITY_THRESHOLD].items():
+        warnings.add(
+            f"Feature '{col}' has {n_unique} unique values (high cardinality). "
+            f"Rare values will be grouped for encoding."
+        )
 
     return warnings
 
 
+def _exceeds_cardinality(series: pd.Series, threshold: int) -> bool:
+    """
+    Whether series has more than threshold distinct non-missing values.
+
+    Exact, but exits early where it can: a categorical with at most
+    threshold categories cannot exceed it, and if the first
+    CARDINALITY_PROBE_ROWS rows already do, the whole column does. Only
+    columns in between pay for a full nunique().
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype) and len(series.cat.categories) <= threshold:
+        return False
+    if len(series) > CARDINALITY_PROBE_ROWS:
+        if series.iloc[:CARDINALITY_PROBE_ROWS].nunique() > threshold:
+            return True
+    return series.nunique() > threshold
+
+
+def _most_frequent_value(series: pd.Series):
+    """
+    Mode of a non-numeric series (smallest value on ties, like
+    series.mode().iloc[0]), or None if it has no values.
+
+    For 'category' dtype this is an argmax over a bincount of the codes,
+    with no sort of the unique values; codes follow category order, so the
+    first maximum is the same value mode() would put first.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        if len(codes) == 0:
+            return None
+        return series.cat.categories[np.bincount(codes).argmax()]
+    modes = series.mode()
+    return modes.iloc[0] if len(modes) > 0 else None
+
+
+def _is_number_dtype(dtype) -> bool:
+    """Whether select_dtypes(include=[np.number]) would pick this dtype."""
+    return (
+        pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    ) or pd.api.types.is_timedelta64_dtype(dtype)
+
+
 def prepare_data_for_tabpfn(
     df: pd.DataFrame,
     target_column: str,
@@ -191,25 +291,59 @@ def prepare_data_for_tabpfn(
     X = X[valid_mask]
     y = y[valid_mask]
 
-    # Handle missing values in features
-    for col in X.columns:
-        if X[col].isna().any():
-            if pd.api.types.is_numeric_dtype(X[col]):
-                X[col] = X[col].fillna(X[col].median())
-            else:
-                X[col] = X[col].fillna(X[col].mode().iloc[0] if len(X[col].mode()) > 0 else "missing")
-
-    # Handle high-cardinality categoricals
-    for col in X.columns:
-        if X[col].dtype == "object" or X[col].dtype.name == "category":
-            if X[col].nunique() > HIGH_CARDINALITY_THRESHOLD:
-                X[col] = handle_high_cardinality_categorical(X[col])
-
-    # Encode categorical features
-    for col in X.columns:
-        if X[col].dtype == "object" or X[col].dtype.name == "category":
-            # Simple label encoding
-            X[col] = pd.Categorical(X[col]).codes
+    # Strings become 'category' once, so the mode, nunique and encoding
+    # steps below work on integer codes instead of re-hashing strings
+    object_cols = X.select_dtypes(include=["object"]).columns
+    if len(object_cols) > 0:
+        X[object_cols] = X[object_cols].astype("category")
+
+    # Handle missing values in features: one vectorized fill per dtype group
+    # (median for numeric, mode for the rest) instead of one per column
+    missing_cols = X.columns[X.isna().any().to_numpy()]
+    if len(missing_cols) > 0:
+        is_numeric = X[missing_cols].dtypes.map(pd.api.types.is_numeric_dtype).to_numpy()
+        num_cols = missing_cols[is_numeric]
+        other_cols = missing_cols[~is_numeric]
+        if len(num_cols) > 0:
+            X[num_cols] = X[num_cols].fillna(X[num_cols].median())
+        if len(other_cols) > 0:
+            modes = {}
+            for col in other_cols:
+                mode = _most_frequent_value(X[col])
+                if mode is not None:
+                    modes[col] = mode
+            if modes:
+                mode_cols = list(modes)
+                X[mode_cols] = X[mode_cols].fillna(modes)
+            # Columns with no values at all have no mode
+            empty_cols = other_cols[X[other_cols].isna().any().to_numpy()]
+            for col in empty_cols:
+                if isinstance(X[col].dtype, pd.CategoricalDtype):
+                    X[col] = X[col].cat.add_categories("missing")
+            if len(empty_cols) > 0:
+                X[empty_cols] = X[empty_cols].fillna("missing")
+
+    # Categorical columns are selected once; only these are visited below
+    categorical_cols = X.select_dtypes(include=["object", "category"]).columns
+
+    for col in categorical_cols:
+        # Handle high-cardinality categoricals
+        if _exceeds_cardinality(X[col], HIGH_CARDINALITY_THRESHOLD):
+            X[col] = handle_high_cardinality_categorical(X[col])
+
+        # Simple label encoding (codes follow sorted / category order),
+        # stored in the narrowest integer type that fits
+        if isinstance(X[col].dtype, pd.CategoricalDtype):
+            X[col] = X[col].cat.codes
+        else:
+            X[col] = pd.to_numeric(pd.factorize(X[col], sort=True)[0], downcast="integer")
+
+    # TabPFN computes in float32 anyway; halving float width halves the
+    # memory traffic of everything downstream (selection, CV, importance).
+    # to_numeric only narrows a column whose values survive the round trip,
+    # so huge values (inf in float32) and ID-like floats stay float64.
+    for col in X.select_dtypes(include=["float64"]).columns:
+        X[col] = pd.to_numeric(X[col], downcast="float")
 
     # Handle too many features
     if X.shape[1] > MAX_FEATURES_FOR_TABPFN:
@@ -15,10 +15,11 @@ import logging
 import numpy as np
 import pandas as pd
 from scipy import stats
-from typing import Optional
+from typing import List, Optional, Union
 
 from intuitiveness.quality.models import FeatureProfile
 from intuitiveness.utils import (
+    classify_dtype,
     detect_feature_type,
     MIN_ROWS_FOR_ASSESSMENT,
     MAX_ROWS_FOR_TABPFN,
@@ -46,28 +47,75 @@ def compute_feature_profile(
         FeatureProfile instance.
     """
     series = df[feature_name]
-    feature_type = detect_feature_type(series)
+    unique_count = series.nunique()
+
+    return _profile_from_counts(
+        series,
+        feature_name,
+        missing_count=series.isna().sum(),
+        unique_count=unique_count,
+        feature_type=detect_feature_type(series, unique_count=unique_count),
+        importance_score=importance_score,
+        shap_mean=shap_mean,
+    )
+
+
+def _column_skewness(values: np.ndarray) -> np.ndarray:
+    """
+    Per-column skewness of a 2D float array, ignoring NaNs.
+
+    Same statistic as scipy.stats.skew (biased, NaN for near-constant
+    columns) on each column's non-missing values, computed for all columns
+    in a few vectorized passes instead of one SciPy call per column.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        counts = np.count_nonzero(~np.isnan(values), axis=0)
+        mean = np.nansum(values, axis=0) / counts
+        deviations = values - mean
+        squared = deviations * deviations
+        m2 = np.nansum(squared, axis=0) / counts
+        m3 = np.nansum(squared * deviations, axis=0) / counts
+        near_constant = m2 <= (np.finfo(np.float64).eps * mean) ** 2
+        return np.where(near_constant, np.nan, m3 / m2 ** 1.5)
+
+
+def _profile_from_counts(
+    series: pd.Series,
+    feature_name: str,
+    missing_count: int,
+    unique_count: int,
+    feature_type: str,
+    importance_score: float,
+    shap_mean: float,
+    distribution_skew: Optional[float] = None,
+) -> FeatureProfile:
+    """
+    Build a FeatureProfile from column statistics computed by the caller.
 
-    missing_count = series.isna().sum()
+    distribution_skew, if given, is the precomputed skewness of a numeric
+    feature; otherwise it is computed here.
+    """
     missing_ratio = missing_count / len(series)
-    unique_count = series.nunique()
 
     # Compute skewness for numeric features
-    distribution_skew = 0.0
     suggested_transform = None
-    if feature_type == "numeric":
+    if feature_type != "numeric":
+        distribution_skew = 0.0
+    elif distribution_skew is None:
+        distribution_skew = 0.0
         clean_series = series.dropna()
         if len(clean_series) > 0:
             try:
                 distribution_skew = float(stats.skew(clean_series))
-                # Suggest log transform for highly skewed distributions
-                if abs(distribution_skew) > 2:
-                    suggested_transform = "log"
-                elif abs(distribution_skew) > 1:
-                    suggested_transform = "sqrt"
             except Exception:
                 pass
 
+    # Suggest log transform for highly skewed distributions
+    if abs(distribution_skew) > 2:
+        suggested_transform = "log"
+    elif abs(distribution_skew) > 1:
+        suggested_transform = "sqrt"
+
     return FeatureProfile(
         feature_name=feature_name,
         feature_type=feature_type,
@@ -81,7 +129,32 @@ def compute_feature_profile(
     )
 
 
-def compute_data_completeness(df: pd.DataFrame) -> float:
+def compute_all_stats(df: pd.DataFrame, target_column: str) -> dict:
+    """
+    Compute the per-column statistics shared by the quality scores.
+
+    One isna() pass and one nunique() pass over the whole DataFrame, reused
+    by compute_data_completeness, compute_feature_diversity and
+    build_feature_profiles (pass the result as their ``column_stats`` argument)
+    instead of each of them scanning the frame again.
+
+    Args:
+        df: DataFrame to assess.
+        target_column: Target column name.
+
+    Returns:
+        Dict with 'missing_counts' and 'unique_counts' (Series indexed by
+        column), 'row_count' and 'target_column'.
+    """
+    return {
+        "missing_counts": df.isna().sum(),
+        "unique_counts": df.nunique(),
+        "row_count": len(df),
+        "target_column": target_column,
+    }
+
+
+def compute_data_completeness(df: pd.DataFrame, column_stats: Optional[dict] = None) -> float:
     """
     Compute data completeness score (0-100).
 
@@ -89,18 +162,26 @@ def compute_data_completeness(df: pd.DataFrame) -> float:
 
     Args:
         df: DataFrame to assess.
+        column_stats: Optional result of compute_all_stats(df, ...).
 
     Returns:
         Completeness score 0-100.
     """
-    total_cells = df.shape[0] * df.shape[1]
+    total_cells = df.size
     if total_cells == 0:
         return 0.0
-    missing_cells = df.isna().sum().sum()
-    return (1 - missing_cells / total_cells) * 100
+    if column_stats is not None:
+        return (1 - column_stats["missing_counts"].sum() / total_cells) * 100
+    # count() tallies non-null cells per column without materialising an
+    # n x k boolean mask the way isna().sum().sum() does
+    return (df.count().sum() / total_cells) * 100
 
 
-def compute_feature_diversity(df: pd.DataFrame, target_column: str) -> float:
+def compute_feature_diversity(
+    df: pd.DataFrame,
+    target_column: str,
+    column_stats: Optional[dict] = None,
+) -> float:
     """
     Compute feature type diversity score (0-100).
 
@@ -110,6 +191,7 @@ def compute_feature_diversity(df: pd.DataFrame, target_column: str) -> float:
     Args:
         df: DataFrame to assess.
         target_column: Target column to exclude.
+        column_stats: Optional result of compute_all_stats(df, target_column).
 
     Returns:
         Diversity score 0-100.
@@ -118,29 +200,34 @@ def compute_feature_diversity(df: pd.DataFrame, target_column: str) -> float:
     if not feature_columns:
         return 0.0
 
+    # Types follow from dtypes alone, except numeric columns (few unique
+    # values = categorical): count those in one batched nunique()
+    numeric_columns = [
+        col for col in feature_columns if classify_dtype(df[col].dtype) == "numeric"
+    ]
+    if column_stats is not None:
+        unique_counts = column_stats["unique_counts"]
+    else:
+        unique_counts = df[numeric_columns].nunique() if numeric_columns else {}
+
     # Count feature types
-    type_counts = {"numeric": 0, "categorical": 0, "boolean": 0, "datetime": 0}
-    for col in feature_columns:
-        ftype = detect_feature_type(df[col])
-        type_counts[ftype] += 1
-
-    # Compute entropy
-    total = sum(type_counts.values())
-    if total == 0:
-        return 0.0
+    type_counts = pd.Series([
+        detect_feature_type(df[col], unique_count=unique_counts.get(col))
+        for col in feature_columns
+    ]).value_counts().to_numpy()
 
-    probs = [count / total for count in type_counts.values() if count > 0]
-    if len(probs) <= 1:
+    if len(type_counts) <= 1:
         return 25.0  # Only one type = low diversity
 
-    entropy = -sum(p * np.log2(p) for p in probs)
-    max_entropy = np.log2(len(probs))  # Maximum possible entropy
+    # Compute entropy (scipy normalizes the counts to probabilities)
+    entropy = stats.entropy(type_counts, base=2)
+    max_entropy = np.log2(len(type_counts))  # Maximum possible entropy
 
     # Normalize to 0-100
     return (entropy / max_entropy) * 100 if max_entropy > 0 else 0.0
 
 
-def compute_size_appropriateness(row_count: int) -> float:
+def compute_size_appropriateness(row_count: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Compute size appropriateness score (0-100).
 
@@ -148,23 +235,27 @@ def compute_size_appropriateness(row_count: int) -> float:
     Score penalizes datasets outside this range.
 
     Args:
-        row_count: Number of rows in dataset.
+        row_count: Number of rows in dataset, or an array of row counts
+            (scored element-wise, e.g. for batch assessment).
 
     Returns:
-        Size score 0-100.
+        Size score 0-100 (array of scores for array input).
     """
-    if row_count < MIN_ROWS_FOR_ASSESSMENT:
+    rows = np.asarray(row_count, dtype=np.float64)
+    scores = np.where(
+        rows < MIN_ROWS_FOR_ASSESSMENT,
         # Linear penalty for too few rows
-        return max(0, (row_count / MIN_ROWS_FOR_ASSESSMENT) * 50)
-    elif row_count <= MAX_ROWS_FOR_TABPFN:
-        # Optimal range
-        return 100.0
-    else:
-        # Gradual penalty for large datasets (still usable via sampling)
-        # Drops to 70 at 50k rows, 50 at 100k rows
-        excess = row_count - MAX_ROWS_FOR_TABPFN
-        penalty = min(50, excess / 2000)  # Max 50 point penalty
-        return 100 - penalty
+        np.maximum(0, (rows / MIN_ROWS_FOR_ASSESSMENT) * 50),
+        np.where(
+            rows <= MAX_ROWS_FOR_TABPFN,
+            # Optimal range
+            100.0,
+            # Gradual penalty for large datasets (still usable via sampling)
+            # Drops to 70 at 50k rows, 50 at 100k rows; max 50 point penalty
+            100 - np.minimum(50, (rows - MAX_ROWS_FOR_TABPFN) / 2000),
+        ),
+    )
+    return float(scores) if scores.ndim == 0 else scores
 
 
 def compute_usability_score(
@@ -202,6 +293,9 @@ def build_feature_profiles(
     target_column: str,
     importance_scores: Optional[dict] = None,
     shap_values: Optional[dict] = None,
+    feature_columns: Optional[List[str]] = None,
+    sort_by_importance: bool = True,
+    column_stats: Optional[dict] = None,
 ) -> list[FeatureProfile]:
     """
     Build feature profiles for all features in dataset.
@@ -211,6 +305,9 @@ def build_feature_profiles(
         target_column: Target column to exclude.
         importance_scores: Optional dict mapping feature names to importance scores.
         shap_values: Optional dict mapping feature names to SHAP mean values.
+        feature_columns: Columns to profile (default: all except target).
+        sort_by_importance: If False, keep feature_columns order.
+        column_stats: Optional result of compute_all_stats(df, target_column).
 
     Returns:
         List of FeatureProfile objects.
@@ -218,20 +315,57 @@ def build_feature_profiles(
     importance_scores = importance_scores or {}
     shap_values = shap_values or {}
 
-    profiles = []
-    for col in df.columns:
-        if col == target_column:
-            continue
+    if feature_columns is None:
+        feature_columns = [c for c in df.columns if c != target_column]
+    features = df[feature_columns]
 
-        profile = compute_feature_profile(
-            df,
-            col,
-            importance_score=importance_scores.get(col, 0.0),
-            shap_mean=shap_values.get(col, 0.0),
-        )
-        profiles.append(profile)
+    # Missing and unique counts for every feature in one call each, instead
+    # of two separate scans per feature
+    if column_stats is not None:
+        missing_counts = column_stats["missing_counts"]
+        unique_counts = column_stats["unique_counts"]
+    else:
+        missing_counts = features.isna().sum()
+        unique_counts = features.nunique()
+
+    feature_types = {
+        col: detect_feature_type(features[col], unique_count=unique_counts[col])
+        for col in feature_columns
+    }
+
+    # Skewness of all numeric features from one float matrix (0 for the rest)
+    is_numeric = np.array([feature_types[col] == "numeric" for col in feature_columns], dtype=bool)
+    skews = np.zeros(len(feature_columns), dtype=np.float64)
+    if is_numeric.any():
+        numeric_columns = [col for col, numeric in zip(feature_columns, is_numeric) if numeric]
+        values = features[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        skews[is_numeric] = _column_skewness(values)
+
+    # One row of statistics per feature, then one FeatureProfile per row,
+    # instead of assembling each profile from per-column lookups
+    missing = missing_counts.reindex(feature_columns).to_numpy(dtype=np.int64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        missing_ratio = missing / len(features)
+    abs_skews = np.abs(skews)
+    stats_df = pd.DataFrame({
+        "feature_name": feature_columns,
+        "feature_type": [feature_types[col] for col in feature_columns],
+        "missing_count": missing,
+        "missing_ratio": missing_ratio,
+        "unique_count": unique_counts.reindex(feature_columns).to_numpy(dtype=np.int64),
+        "importance_score": [importance_scores.get(col, 0.0) for col in feature_columns],
+        "shap_mean": [shap_values.get(col, 0.0) for col in feature_columns],
+        "distribution_skew": skews,
+        # Suggest log transform for highly skewed distributions
+        "suggested_transform": np.where(
+            abs_skews > 2, "log", np.where(abs_skews > 1, "sqrt", None)
+        ),
+    })
+
+    profiles = [FeatureProfile(**row) for row in stats_df.to_dict(orient="records")]
 
     # Sort by importance score
-    profiles.sort(key=lambda p: p.importance_score, reverse=True)
+    if sort_by_importance:
+        profiles.sort(key=lambda p: p.importance_score, reverse=True)
 
     return profiles
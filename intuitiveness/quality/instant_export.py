@@ -23,8 +23,17 @@ Target Users: Domain experts with NO familiarity with data structures
 Author: Intuitiveness Framework
 """
 
+import atexit
+import gzip
+import hashlib
+import io
 import logging
+import os
+import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Literal, Callable, List
 import numpy as np
 import pandas as pd
@@ -33,7 +42,7 @@ from intuitiveness.quality.models import (
     ExportResult,
     CleaningAction,
 )
-from intuitiveness.quality.tabpfn_wrapper import TabPFNWrapper, is_tabpfn_available
+from intuitiveness.quality.data_preparer import handle_high_cardinality_categorical
 from intuitiveness.utils import (
     detect_task_type,
     detect_feature_type,
@@ -44,6 +53,32 @@ from intuitiveness.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for per-column cleaning work (see _map_columns), shared by
+# every export instead of one pool per call. Threads start on first use.
+_COLUMN_WORKERS = os.cpu_count() or 1
+_COLUMN_EXECUTOR = ThreadPoolExecutor(max_workers=_COLUMN_WORKERS, thread_name_prefix="instant-export")
+atexit.register(_COLUMN_EXECUTOR.shutdown, wait=False)
+
+# Quick-validation scores memoised per validated data (see _quick_tabpfn_check);
+# Streamlit reruns call check_and_export again on unchanged data
+VALIDATION_CACHE_SIZE = 32
+
+# Rows formatted per to_csv() chunk when exporting
+CSV_EXPORT_CHUNK_ROWS = 10_000
+
+# Warnings that block readiness (see _determine_readiness), matched in one
+# case-insensitive pass per warning
+CRITICAL_WARNING_PHRASES = [
+    "too many empty",
+    "couldn't be used",
+    "need more data",
+]
+_CRITICAL_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in CRITICAL_WARNING_PHRASES), re.IGNORECASE
+)
+_validation_cache: "OrderedDict[str, float]" = OrderedDict()
+_validation_cache_lock = threading.Lock()
+
 # ============================================================================
 # PLAIN LANGUAGE TEMPLATES (No ML Jargon - FR-002, SC-004)
 # ============================================================================
@@ -68,6 +103,153 @@ PLAIN_WARNINGS = {
 }
 
 
+# ============================================================================
+# COLUMN SCAN KERNEL
+# ============================================================================
+
+
+def _scan_float_columns(values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Missing count, unique count and median of every column of a float array.
+
+    One column-wise sort serves all three statistics: NaNs sort last, so the
+    non-missing values are a sorted prefix whose length gives the missing
+    count, whose value changes give the unique count and whose middle gives
+    the median. Matches isna().sum(), nunique() and median() per column.
+
+    Args:
+        values: 2D float64 array, one column per feature.
+
+    Returns:
+        (missing_counts, unique_counts, medians), one entry per column;
+        the median is NaN for columns with no values.
+    """
+    n_rows, n_cols = values.shape
+    if n_rows == 0:
+        return np.zeros(n_cols, dtype=np.int64), np.zeros(n_cols, dtype=np.int64), np.full(n_cols, np.nan)
+
+    ordered = np.sort(values, axis=0)
+    n_present = np.count_nonzero(~np.isnan(ordered), axis=0)
+
+    # A new value starts wherever consecutive sorted entries differ; only
+    # changes inside the non-missing prefix count
+    changes = (ordered[1:] != ordered[:-1]) & (np.arange(1, n_rows)[:, None] < n_present)
+    unique_counts = np.where(n_present > 0, 1 + np.count_nonzero(changes, axis=0), 0)
+
+    columns = np.arange(n_cols)
+    low = ordered[np.maximum((n_present - 1) // 2, 0), columns]
+    high = ordered[np.minimum(n_present // 2, n_rows - 1), columns]
+    with np.errstate(invalid="ignore"):
+        medians = np.where(n_present > 0, (low + high) / 2, np.nan)
+
+    return (n_rows - n_present).astype(np.int64), unique_counts.astype(np.int64), medians
+
+
+def _has_variation(series: pd.Series, probe_rows: int = 1000) -> bool:
+    """
+    Whether series has at least two distinct non-missing values.
+
+    Same answer as series.nunique() >= 2, but usually without hashing the
+    whole column: a varied column shows it within the first probe_rows,
+    and otherwise one vectorized comparison against the first value
+    settles it.
+    """
+    if series.head(probe_rows).nunique() >= 2:
+        return True
+    values = series.dropna()
+    return len(values) > 0 and bool((values != values.iloc[0]).any())
+
+
+def _count_values(series: pd.Series) -> tuple[int, pd.Series]:
+    """
+    Missing count and non-missing value counts of series from one hash pass.
+
+    value_counts(dropna=False) bins the missing values alongside the rest,
+    so the missing count (isna().sum()) and the unique count (nunique(),
+    the length of the returned counts) come from the same scan.
+
+    Returns:
+        (missing_count, counts): counts holds the observed non-missing
+        values, most frequent first, as series.value_counts() would.
+    """
+    counts = series.value_counts(dropna=False)
+    missing = counts.index.isna()
+    n_missing = int(counts[missing].sum()) if missing.any() else 0
+    counts = counts[~missing]
+    # Unused categories of a categorical column are listed with count 0
+    return n_missing, counts[counts > 0]
+
+
+def _validation_cache_key(
+    df: pd.DataFrame,
+    target_column: str,
+    task_type: str,
+) -> Optional[str]:
+    """
+    Digest identifying a quick-validation run: every cell, column label and
+    dtype of df plus the target and task type. None if df can't be hashed.
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        # Unhashable cells (e.g. lists): don't memoise
+        return None
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    digest.update(repr((list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+    return f"{digest.hexdigest()}:{task_type}:{target_column}"
+
+
+def _encode_categorical(series: pd.Series, high_cardinality: bool) -> np.ndarray:
+    """
+    Label-encode a categorical column, grouping rare values first if it
+    has too many distinct values.
+    """
+    if high_cardinality:
+        # Keep top 99 values, group rest as "other" (vectorized isin
+        # mask + select rather than a Python callback per row)
+        series = handle_high_cardinality_categorical(
+            series, threshold=HIGH_CARDINALITY_THRESHOLD
+        )
+    # factorize is the routine Categorical runs internally, minus the
+    # wrapper; codes are sorted like Categorical's and stored in the
+    # narrowest integer type that fits
+    codes, _ = pd.factorize(series, sort=True)
+    return pd.to_numeric(codes, downcast="integer")
+
+
+def _map_columns(func: Callable, *column_args: list) -> list:
+    """
+    Apply func to each column's arguments, in order, on the shared pool.
+
+    Columns are independent and the pandas / NumPy kernels doing the work
+    (value_counts, factorize, isin) release the GIL for numeric data, so
+    columns are processed concurrently on multi-core machines. Runs inline
+    when only one worker would be used.
+    """
+    n_columns = len(column_args[0]) if column_args else 0
+    if min(_COLUMN_WORKERS, n_columns) <= 1:
+        return list(map(func, *column_args))
+    return list(_COLUMN_EXECUTOR.map(func, *column_args))
+
+
+def _most_common_value(series: pd.Series, default=None, counts: Optional[pd.Series] = None):
+    """
+    Most frequent non-missing value of series, or default if it has none.
+
+    Same value as series.mode().iloc[0]: value_counts() finds it in one
+    hash pass without sorting the unique values, and only when the top
+    count is tied does mode() run to pick the smallest of the tied values.
+    counts, if given, is series.value_counts() computed by the caller.
+    """
+    if counts is None:
+        counts = series.value_counts()
+    if len(counts) == 0 or counts.iloc[0] == 0:
+        return default
+    if len(counts) > 1 and counts.iloc[1] == counts.iloc[0]:
+        return series.mode().iloc[0]
+    return counts.index[0]
+
+
 # ============================================================================
 # INSTANT EXPORTER CLASS
 # ============================================================================
@@ -143,7 +325,10 @@ class InstantExporter:
         # ────────────────────────────────────────────────────────────────────
         report("Checking your data...", 0.0)
 
-        validation_issues = self._validate_basic(df, target_column)
+        # Feature columns are listed once and shared by validation and cleaning
+        feature_cols = [c for c in df.columns if c != target_column]
+
+        validation_issues = self._validate_basic(df, target_column, feature_cols)
         if validation_issues:
             return ExportResult(
                 is_ready=False,
@@ -163,7 +348,8 @@ class InstantExporter:
         report("Auto-fixing common issues...", 0.25)
 
         cleaned_df, cleaning_actions, warnings = self._auto_clean(
-            df, target_column, progress_callback=lambda m, p: report(m, 0.3 + p * 0.3)
+            df, target_column, progress_callback=lambda m, p: report(m, 0.3 + p * 0.3),
+            feature_cols=feature_cols,
         )
 
         report("Data cleaned", 0.6)
@@ -230,10 +416,14 @@ class InstantExporter:
         self,
         df: pd.DataFrame,
         target_column: str,
+        feature_cols: Optional[List[str]] = None,
     ) -> List[str]:
         """
         Run basic validation checks (no API calls).
 
+        feature_cols, if given, lists the columns other than the target
+        (computed by the caller so it is not rebuilt here).
+
         Returns list of blocking issues (empty = valid).
         """
         issues = []
@@ -249,12 +439,13 @@ class InstantExporter:
             return issues
 
         # Check target has variation
-        if df[target_column].nunique() < 2:
+        if not _has_variation(df[target_column]):
             issues.append("The column you selected has only one value - nothing to analyze.")
             return issues
 
         # Check we have at least one usable feature
-        feature_cols = [c for c in df.columns if c != target_column]
+        if feature_cols is None:
+            feature_cols = [c for c in df.columns if c != target_column]
         if not feature_cols:
             issues.append("Your data needs at least one column besides the target.")
             return issues
@@ -270,10 +461,14 @@ class InstantExporter:
         df: pd.DataFrame,
         target_column: str,
         progress_callback: Optional[Callable[[str, float], None]] = None,
+        feature_cols: Optional[List[str]] = None,
     ) -> tuple[pd.DataFrame, List[CleaningAction], List[str]]:
         """
         Auto-clean data with plain-language logging.
 
+        feature_cols, if given, lists the columns other than the target in
+        frame order (as computed once by check_and_export).
+
         Handles:
         - Infinite values (Inf/-Inf converted to missing)
         - Missing values (median for numbers, mode for text)
@@ -284,7 +479,10 @@ class InstantExporter:
         Returns:
             (cleaned_df, cleaning_actions, warnings)
         """
-        cleaned = df.copy()
+        # Shallow copy: every change below assigns whole columns (or builds a
+        # new frame), which replaces the column in `cleaned` without writing
+        # into df's arrays, so only modified columns are ever allocated
+        cleaned = df.copy(deep=False)
         actions = []
         warnings = []
 
@@ -292,23 +490,35 @@ class InstantExporter:
             if progress_callback:
                 progress_callback(message, progress)
 
-        feature_cols = [c for c in cleaned.columns if c != target_column]
+        if feature_cols is None:
+            feature_cols = [c for c in cleaned.columns if c != target_column]
         total_cols = len(feature_cols)
 
         # ────────────────────────────────────────────────────────────────────
         # Step 0: Handle Inf/-Inf values (CRITICAL - crashes TabPFN otherwise)
         # ────────────────────────────────────────────────────────────────────
-        for col in cleaned.columns:
-            if pd.api.types.is_numeric_dtype(cleaned[col]):
-                inf_count = np.isinf(cleaned[col]).sum()
-                if inf_count > 0:
-                    cleaned[col] = cleaned[col].replace([np.inf, -np.inf], np.nan)
-                    actions.append(CleaningAction(
-                        action_type="convert_type",
-                        column=col,
-                        description=f"Replaced {inf_count} extreme values in '{col}' with empty cells",
-                        rows_affected=inf_count,
-                    ))
+        # One isinf pass over all numeric columns; replace() only touches the
+        # columns that actually contain Inf. Dtypes are read once here and
+        # reused below: neither the Inf replacement (floats stay floats) nor
+        # the target dropna changes them
+        column_dtypes = dict(cleaned.dtypes.items())
+        numeric_cols = [
+            col for col, dtype in column_dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype)
+        ]
+        if numeric_cols:
+            inf_counts = np.isinf(cleaned[numeric_cols]).sum()
+            inf_cols = inf_counts.index[inf_counts.to_numpy() > 0].tolist()
+            if inf_cols:
+                cleaned[inf_cols] = cleaned[inf_cols].replace([np.inf, -np.inf], np.nan)
+            for col in inf_cols:
+                inf_count = inf_counts[col]
+                actions.append(CleaningAction(
+                    action_type="convert_type",
+                    column=col,
+                    description=f"Replaced {inf_count} extreme values in '{col}' with empty cells",
+                    rows_affected=inf_count,
+                ))
 
         # ────────────────────────────────────────────────────────────────────
         # Step 1: Remove target rows with missing values
@@ -324,89 +534,128 @@ class InstantExporter:
             ))
             if target_missing > len(df) * 0.1:
                 warnings.append(PLAIN_WARNINGS["rows_with_issues"])
+        # Row count is fixed from here on (later steps only change columns)
+        n_rows = len(cleaned)
 
         # ────────────────────────────────────────────────────────────────────
         # Step 2: Process each feature column
         # ────────────────────────────────────────────────────────────────────
-        cols_to_drop = []
+        # Usability statistics and missing-value fills are computed for all
+        # feature columns at once; only the per-column encoding and action
+        # logging remain in the loop. Float columns get missing count, unique
+        # count and median from one sort (_scan_float_columns), the rest from
+        # one value_counts() each (_count_values), kept for the mode fill.
+        float_cols = [
+            col for col in feature_cols
+            if isinstance(column_dtypes[col], np.dtype) and column_dtypes[col].kind == "f"
+        ]
+        float_set = set(float_cols)
+        other_cols = [col for col in feature_cols if col not in float_set]
+        float_missing, float_unique, float_medians = _scan_float_columns(
+            cleaned[float_cols].to_numpy(dtype=np.float64)
+        )
+        float_medians = dict(zip(float_cols, float_medians.tolist()))
+        other_counts = dict(zip(
+            other_cols, _map_columns(_count_values, [cleaned[col] for col in other_cols])
+        ))
+        n_missing = pd.concat([
+            pd.Series(float_missing, index=float_cols, dtype=np.int64),
+            pd.Series(
+                [missing for missing, _ in other_counts.values()],
+                index=other_cols, dtype=np.int64,
+            ),
+        ]).reindex(feature_cols)
+        n_unique = pd.concat([
+            pd.Series(float_unique, index=float_cols, dtype=np.int64),
+            pd.Series(
+                [len(counts) for _, counts in other_counts.values()],
+                index=other_cols, dtype=np.int64,
+            ),
+        ]).reindex(feature_cols)
+        if n_rows > 0:
+            too_empty = n_missing / n_rows > 0.9
+        else:
+            too_empty = pd.Series(True, index=n_missing.index)
+        single_value = n_unique <= 1
+        cols_to_drop = [
+            col for col in feature_cols if single_value[col] or too_empty[col]
+        ]
+
+        # Each usable column's type is detected once, from the unique count
+        # above, and reused for filling and encoding (filling with the median
+        # or mode never changes the detected type)
+        feature_types = {
+            col: detect_feature_type(cleaned[col], unique_count=n_unique[col])
+            for col in feature_cols
+            if not (single_value[col] or too_empty[col])
+        }
+        fill_cols = [col for col in feature_types if n_missing[col] > 0]
+
+        # Handle missing values: median for numbers, mode for the rest
+        numeric_fill = [col for col in fill_cols if feature_types[col] == "numeric"]
+        if numeric_fill:
+            medians = {col: float_medians[col] for col in numeric_fill if col in float_set}
+            non_float = [col for col in numeric_fill if col not in float_set]
+            if non_float:
+                medians.update(cleaned[non_float].median().to_dict())
+            cleaned[numeric_fill] = cleaned[numeric_fill].fillna(medians)
+        other_fill = [col for col in fill_cols if feature_types[col] != "numeric"]
+        if other_fill:
+            cleaned[other_fill] = cleaned[other_fill].fillna({
+                col: _most_common_value(
+                    cleaned[col], default="unknown", counts=other_counts.get(col, (0, None))[1],
+                )
+                for col in other_fill
+            })
+
+        # Group rare values and encode categoricals; the plain-language log
+        # is kept as (action_type, column, description, rows_affected) rows
+        # and turned into CleaningAction objects in one go afterwards
+        categorical_cols = [col for col, ftype in feature_types.items() if ftype == "categorical"]
+        high_cardinality_cols = {
+            col for col in categorical_cols if n_unique[col] > HIGH_CARDINALITY_THRESHOLD
+        }
+        encoded = _map_columns(
+            _encode_categorical,
+            [cleaned[col] for col in categorical_cols],
+            [col in high_cardinality_cols for col in categorical_cols],
+        )
+        for col, codes in zip(categorical_cols, encoded):
+            cleaned[col] = codes
 
+        action_log = []
         for i, col in enumerate(feature_cols):
             report(f"Processing column {i+1}/{total_cols}", i / total_cols)
 
-            # Check if column is usable
-            n_unique = cleaned[col].nunique()
-            n_missing = cleaned[col].isna().sum()
-            missing_ratio = n_missing / len(cleaned) if len(cleaned) > 0 else 1.0
-
             # Drop unusable columns
-            if n_unique <= 1:
-                cols_to_drop.append(col)
-                actions.append(CleaningAction(
-                    action_type="remove_column",
-                    column=col,
-                    description=f"Removed '{col}' - only one value",
-                    rows_affected=0,
-                ))
+            if single_value[col]:
+                action_log.append(("remove_column", col, f"Removed '{col}' - only one value", 0))
                 continue
-
-            if missing_ratio > 0.9:
-                cols_to_drop.append(col)
-                actions.append(CleaningAction(
-                    action_type="remove_column",
-                    column=col,
-                    description=f"Removed '{col}' - too many empty cells",
-                    rows_affected=0,
-                ))
+            if too_empty[col]:
+                action_log.append(("remove_column", col, f"Removed '{col}' - too many empty cells", 0))
                 continue
 
-            # Handle missing values
-            if n_missing > 0:
-                feature_type = detect_feature_type(cleaned[col])
-                if feature_type == "numeric":
-                    fill_value = cleaned[col].median()
-                    cleaned[col] = cleaned[col].fillna(fill_value)
-                    actions.append(CleaningAction(
-                        action_type="fill_missing",
-                        column=col,
-                        description=f"Filled {n_missing} empty cells in '{col}' with typical value",
-                        rows_affected=n_missing,
-                    ))
-                else:
-                    mode_values = cleaned[col].mode()
-                    fill_value = mode_values.iloc[0] if len(mode_values) > 0 else "unknown"
-                    cleaned[col] = cleaned[col].fillna(fill_value)
-                    actions.append(CleaningAction(
-                        action_type="fill_missing",
-                        column=col,
-                        description=f"Filled {n_missing} empty cells in '{col}' with most common value",
-                        rows_affected=n_missing,
-                    ))
-
-            # Handle high-cardinality categoricals
-            feature_type = detect_feature_type(cleaned[col])
-            if feature_type == "categorical" and n_unique > HIGH_CARDINALITY_THRESHOLD:
-                # Keep top 99 values, group rest as "other"
-                top_values = set(cleaned[col].value_counts().head(99).index)
-                cleaned[col] = cleaned[col].apply(
-                    lambda x: x if x in top_values else "_other_"
-                )
-                actions.append(CleaningAction(
-                    action_type="encode_category",
-                    column=col,
-                    description=f"Simplified '{col}' by grouping rare values",
-                    rows_affected=0,
+            feature_type = feature_types[col]
+            if n_missing[col] > 0:
+                fill_kind = "typical value" if feature_type == "numeric" else "most common value"
+                action_log.append((
+                    "fill_missing",
+                    col,
+                    f"Filled {n_missing[col]} empty cells in '{col}' with {fill_kind}",
+                    n_missing[col],
                 ))
+
+            if col in high_cardinality_cols:
+                action_log.append(("encode_category", col, f"Simplified '{col}' by grouping rare values", 0))
                 warnings.append(PLAIN_WARNINGS["high_cardinality"])
 
-            # Encode categoricals for export
             if feature_type == "categorical":
-                cleaned[col] = pd.Categorical(cleaned[col]).codes
-                actions.append(CleaningAction(
-                    action_type="encode_category",
-                    column=col,
-                    description=f"Converted text in '{col}' to numbers",
-                    rows_affected=0,
-                ))
+                action_log.append(("encode_category", col, f"Converted text in '{col}' to numbers", 0))
+
+        actions.extend(
+            CleaningAction(action_type, column, description, rows_affected)
+            for action_type, column, description, rows_affected in action_log
+        )
 
         # Drop unusable columns
         if cols_to_drop:
@@ -424,7 +673,7 @@ class InstantExporter:
                 warnings.append(PLAIN_WARNINGS["text_encoded"])
 
         # Warn about small datasets
-        if len(cleaned) < MIN_ROWS_FOR_ASSESSMENT:
+        if n_rows < MIN_ROWS_FOR_ASSESSMENT:
             warnings.append(PLAIN_WARNINGS["small_dataset"])
 
         report("Cleaning complete", 1.0)
@@ -434,6 +683,12 @@ class InstantExporter:
     # PHASE 3: OPTIONAL TABPFN VALIDATION
     # ========================================================================
 
+    @staticmethod
+    def clear_validation_cache() -> None:
+        """Forget memoised quick-validation scores."""
+        with _validation_cache_lock:
+            _validation_cache.clear()
+
     def _quick_tabpfn_check(
         self,
         df: pd.DataFrame,
@@ -447,7 +702,21 @@ class InstantExporter:
 
         Returns validation score (0-100) or None if unavailable.
         Sets self._validation_error if validation fails.
+
+        Scores are memoised on a hash of the (sampled) data, target and task
+        type, so re-checking identical data returns the earlier score
+        without API calls. Call InstantExporter.clear_validation_cache() to
+        reset.
         """
+        # Imported here, not at module level: loading the wrapper pulls in the
+        # TabPFN backends and resolves API tokens, which exports with
+        # validation disabled never need
+        from intuitiveness.quality.tabpfn_wrapper import (
+            TabPFNWrapper,
+            is_tabpfn_available,
+            _narrow_float_features,
+        )
+
         available, backend = is_tabpfn_available()
         if not available:
             self._validation_error = "TabPFN not installed. Run: pip install tabpfn-client"
@@ -455,32 +724,62 @@ class InstantExporter:
             return None
 
         try:
+            # Sample if too large (TabPFN optimal ≤10K rows), before splitting
+            # off the target so only the sampled rows are ever copied
+            if len(df) > MAX_ROWS_FOR_TABPFN:
+                # Generator.choice draws k of N without permuting all N rows
+                rng = np.random.default_rng(42)
+                sample_idx = rng.choice(
+                    len(df), MAX_ROWS_FOR_TABPFN, replace=False, shuffle=False
+                )
+                df = df.iloc[sample_idx]
+
+            # The split and the model are seeded, so the score depends only
+            # on the sampled data: reuse it when the same data comes back
+            cache_key = _validation_cache_key(df, target_column, task_type)
+            if cache_key is not None:
+                with _validation_cache_lock:
+                    cached_score = _validation_cache.get(cache_key)
+                    if cached_score is not None:
+                        _validation_cache.move_to_end(cache_key)
+                if cached_score is not None:
+                    logger.info(f"Quick TabPFN validation (cached): {cached_score:.1f}%")
+                    return cached_score
+
             # Prepare data
             X = df.drop(columns=[target_column])
             y = df[target_column]
 
-            # Sample if too large (TabPFN optimal ≤10K rows)
-            if len(X) > MAX_ROWS_FOR_TABPFN:
-                sample_idx = np.random.choice(len(X), MAX_ROWS_FOR_TABPFN, replace=False)
-                X = X.iloc[sample_idx]
-                y = y.iloc[sample_idx]
-
             # Simple train/test split (no CV to minimize API calls)
             # Use stratification for classification to handle class imbalance
             from sklearn.model_selection import train_test_split
 
-            stratify_param = y.values if task_type == "classification" else None
+            # Split the pandas objects directly (row takes on each block) and
+            # convert only the two halves, instead of materialising X.values
+            # for the whole frame first
+            stratify_param = y if task_type == "classification" else None
             try:
                 X_train, X_test, y_train, y_test = train_test_split(
-                    X.values, y.values, test_size=0.2, random_state=42,
+                    X, y, test_size=0.2, random_state=42,
                     stratify=stratify_param
                 )
             except ValueError:
                 # Fallback to non-stratified if class count is too small
                 logger.warning("Stratification failed (rare classes), using simple split")
                 X_train, X_test, y_train, y_test = train_test_split(
-                    X.values, y.values, test_size=0.2, random_state=42
+                    X, y, test_size=0.2, random_state=42
+                )
+            # Cleaned features are bools, int codes and floats: hand TabPFN
+            # one float buffer per half, narrowed to float32 only when no
+            # value changes (other dtypes, e.g. datetimes, keep the default
+            # conversion)
+            if all(dtype.kind in "biuf" for dtype in X.dtypes):
+                X_train, X_test = _narrow_float_features(
+                    X_train.to_numpy(dtype=np.float64), X_test.to_numpy(dtype=np.float64)
                 )
+            else:
+                X_train, X_test = X_train.to_numpy(), X_test.to_numpy()
+            y_train, y_test = y_train.to_numpy(), y_test.to_numpy()
 
             # Single TabPFN fit & score
             logger.info(f"Initializing TabPFN with {backend} backend...")
@@ -494,6 +793,12 @@ class InstantExporter:
             # Convert to 0-100 scale
             validation_score = score * 100
             logger.info(f"Quick TabPFN validation: {validation_score:.1f}%")
+
+            if cache_key is not None:
+                with _validation_cache_lock:
+                    _validation_cache[cache_key] = validation_score
+                    while len(_validation_cache) > VALIDATION_CACHE_SIZE:
+                        _validation_cache.popitem(last=False)
             return validation_score
 
         except Exception as e:
@@ -537,14 +842,8 @@ class InstantExporter:
             return False
 
         # Check for critical issues
-        critical_warnings = [
-            "too many empty",
-            "couldn't be used",
-            "need more data",
-        ]
-        for warning in warnings:
-            if any(crit in warning.lower() for crit in critical_warnings):
-                return False
+        if any(_CRITICAL_RE.search(warning) for warning in warnings):
+            return False
 
         return True
 
@@ -576,12 +875,17 @@ def instant_check_and_export(
     return exporter.check_and_export(df, target_column, progress_callback)
 
 
-def export_clean_csv(result: ExportResult) -> bytes:
+def export_clean_csv(result: ExportResult, compress: bool = False) -> bytes:
     """
     Export cleaned DataFrame as CSV bytes.
 
+    Rows are written CSV_EXPORT_CHUNK_ROWS at a time straight into a byte
+    buffer, so the whole CSV never exists as one Python string as well.
+
     Args:
         result: ExportResult from check_and_export.
+        compress: If True, return gzip-compressed CSV (for a .csv.gz
+            download); typically several times smaller.
 
     Returns:
         CSV file contents as bytes.
@@ -589,4 +893,15 @@ def export_clean_csv(result: ExportResult) -> bytes:
     if result.cleaned_df is None:
         raise ValueError("No cleaned DataFrame available")
 
-    return result.cleaned_df.to_csv(index=False).encode("utf-8")
+    buffer = io.BytesIO()
+    if compress:
+        # Level 1: most of the size reduction for a fraction of the CPU time
+        with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=1) as gz:
+            result.cleaned_df.to_csv(
+                gz, index=False, encoding="utf-8", chunksize=CSV_EXPORT_CHUNK_ROWS
+            )
+    else:
+        result.cleaned_df.to_csv(
+            buffer, index=False, encoding="utf-8", chunksize=CSV_EXPORT_CHUNK_ROWS
+        )
+    return buffer.getvalue()
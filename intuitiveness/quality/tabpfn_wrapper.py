@@ -15,9 +15,10 @@ import functools
 import os
 import sys
 import tempfile
+import threading
 from dataclasses import dataclass
-from typing import Optional, Literal, Tuple, Any, List
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Optional, Literal, Tuple, Any, Iterator
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -35,28 +36,59 @@ logger = logging.getLogger(__name__)
 # tabpfn_client modules are imported. This guarantees all imports see the patched path.
 # ============================================================================
 
-_cache_dir = Path(tempfile.gettempdir()) / "tabpfn_cache"
-_cache_dir.mkdir(parents=True, exist_ok=True)
+@functools.lru_cache(maxsize=1)
+def _ensure_cache_dir() -> Path:
+    """
+    TabPFN client cache directory under the temp dir, created on first use
+    rather than by every process that imports this module.
+    """
+    cache_dir = Path(tempfile.gettempdir()) / "tabpfn_cache"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        # Read-only filesystem: authentication bypasses the file cache anyway
+        logger.warning(f"Cannot create TabPFN cache directory {cache_dir}: {e}")
+    return cache_dir
+
+
+class _ConstantsProxy(ModuleType):
+    """
+    Stand-in for tabpfn_client.constants that creates CACHE_DIR and defines
+    ModelVersion (required by estimator.py) only when tabpfn_client first
+    reads them.
+    """
+
+    def __getattr__(self, name):
+        # Plain attributes rather than a property, so a re-import of this
+        # module can still assign CACHE_DIR on an existing proxy
+        if name == "CACHE_DIR":
+            cache_dir = _ensure_cache_dir()
+            setattr(self, name, cache_dir)
+            return cache_dir
+        if name == "ModelVersion":
+            from enum import Enum
+
+            class ModelVersion(str, Enum):
+                V2 = "v2"
+                V2_5 = "v2.5"
+
+            setattr(self, name, ModelVersion)  # later reads skip __getattr__
+            return ModelVersion
+        raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
 
 # Check if tabpfn_client.constants is already loaded
 if "tabpfn_client.constants" in sys.modules:
     # Already loaded - patch it directly
     logger.warning(f"[INIT] tabpfn_client.constants already loaded - patching existing module")
-    sys.modules["tabpfn_client.constants"].CACHE_DIR = _cache_dir
+    sys.modules["tabpfn_client.constants"].CACHE_DIR = _ensure_cache_dir()
 else:
     # Not loaded yet - inject a fake module
-    logger.info(f"[INIT] Injecting fake tabpfn_client.constants module with CACHE_DIR={_cache_dir}")
+    logger.info("[INIT] Injecting fake tabpfn_client.constants module (CACHE_DIR in temp dir)")
 
-    # Create fake constants module
-    _fake_constants = ModuleType("tabpfn_client.constants")
-    _fake_constants.CACHE_DIR = _cache_dir
-
-    # Add ModelVersion enum (required by estimator.py)
-    from enum import Enum
-    class ModelVersion(str, Enum):
-        V2 = "v2"
-        V2_5 = "v2.5"
-    _fake_constants.ModelVersion = ModelVersion
+    # Create fake constants module (CACHE_DIR and ModelVersion are resolved
+    # on first access)
+    _fake_constants = _ConstantsProxy("tabpfn_client.constants")
 
     # Inject into sys.modules BEFORE any tabpfn imports
     sys.modules["tabpfn_client.constants"] = _fake_constants
@@ -78,14 +110,99 @@ class TabPFNTimeoutError(Exception):
     pass
 
 
-def with_timeout(timeout_seconds: float):
+# Rows per backend predict call. Each call is billed for the training rows
+# again (see estimate_api_consumption), so chunks are large: they only give
+# a timed-out prediction points at which to stop
+PREDICT_CHUNK_ROWS = 10_000
+
+# Largest change a float32 cast may make to a feature value; past it the
+# features stay float64. Same tolerance as pd.to_numeric(downcast="float")
+FLOAT32_ROUND_TRIP_ATOL = 5e-4
+
+
+def _can_use_alarm() -> bool:
+    """
+    Whether a SIGALRM timer can time the current call: POSIX only (no
+    setitimer on Windows), signal handlers can only be installed from the
+    main thread, and an interval timer someone else set must not be reset.
+    """
+    return (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+        and signal.getitimer(signal.ITIMER_REAL)[0] == 0
+    )
+
+
+def _run_with_timeout(
+    func,
+    timeout_seconds: float,
+    description: str,
+    *args,
+    cancel: Optional[threading.Event] = None,
+    use_alarm: bool = False,
+    **kwargs,
+):
+    """
+    Call func(*args, **kwargs) on its own daemon thread, waiting at most
+    timeout_seconds.
+
+    With use_alarm=True, on a POSIX main thread with no interval timer
+    already running, func runs inline instead, under a SIGALRM timer: no
+    thread hand-off, and the timeout interrupts func itself. Opt-in only,
+    since the alarm can fire inside any code func calls.
+
+    Raises:
+        TabPFNTimeoutError: "<description> timed out after <timeout>s". The
+            call cannot be killed, so cancel (if given) is set for func to
+            notice and stop.
+    """
+    if use_alarm and _can_use_alarm():
+        def on_alarm(signum, frame):
+            if cancel is not None:
+                cancel.set()
+            raise TabPFNTimeoutError(f"{description} timed out after {timeout_seconds}s")
+
+        previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+        try:
+            # Armed inside the try, so an early alarm still restores both
+            signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+            return func(*args, **kwargs)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    future = Future()
+
+    def run():
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    # One thread per call rather than a shared pool: a timed-out call keeps
+    # running until the backend returns, and must not hold a worker that
+    # later calls would queue behind. Daemon, so it never blocks exit.
+    threading.Thread(target=run, name="tabpfn-timeout", daemon=True).start()
+    try:
+        return future.result(timeout=timeout_seconds)
+    except FuturesTimeoutError:
+        if cancel is not None:
+            cancel.set()
+        raise TabPFNTimeoutError(f"{description} timed out after {timeout_seconds}s")
+
+
+def with_timeout(timeout_seconds: float, use_alarm: bool = False):
     """
     Decorator to add timeout to a function.
 
-    Uses ThreadPoolExecutor for cross-platform compatibility.
+    Runs the function on a worker thread, or under a SIGALRM timer on POSIX
+    main threads if use_alarm is set (see _run_with_timeout).
 
     Args:
         timeout_seconds: Maximum execution time.
+        use_alarm: Time inline calls with SIGALRM where possible.
 
     Returns:
         Decorated function.
@@ -93,80 +210,158 @@ def with_timeout(timeout_seconds: float):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(func, *args, **kwargs)
-                try:
-                    return future.result(timeout=timeout_seconds)
-                except FuturesTimeoutError:
-                    raise TabPFNTimeoutError(
-                        f"{func.__name__} timed out after {timeout_seconds}s"
-                    )
+            return _run_with_timeout(
+                func, timeout_seconds, func.__name__, *args, use_alarm=use_alarm, **kwargs
+            )
         return wrapper
     return decorator
 
-# Backend availability flags
-_TABPFN_CLIENT_AVAILABLE = False
-_TABPFN_LOCAL_AVAILABLE = False
 
-try:
-    # Import TabPFN classes (CACHE_DIR already patched above at module level)
-    from tabpfn_client import TabPFNClassifier as ClientClassifier
-    from tabpfn_client import TabPFNRegressor as ClientRegressor
-    import tabpfn_client
-    _TABPFN_CLIENT_AVAILABLE = True
-    logger.info(f"[INIT] TabPFN client available (cache at {_cache_dir})")
+# ============================================================================
+# LAZY BACKEND LOADING
+# ============================================================================
+# tabpfn_client / tabpfn (and the token lookup) are imported on first use,
+# not when this module is imported: most importers never fit a model, and
+# the client import alone takes a few hundred ms. The old module attributes
+# (ClientClassifier, _TABPFN_CLIENT_AVAILABLE, ...) resolve through
+# __getattr__ below (PEP 562).
+# ============================================================================
 
-    # Auto-load token from Streamlit secrets, environment, or stored file
 
-    _token = None
+@functools.lru_cache(maxsize=1)
+def _load_client_backend() -> Tuple[Any, Any]:
+    """
+    Import the tabpfn-client estimators and authenticate, once.
 
-    # Priority 1: Check Streamlit secrets (for deployed apps)
+    Returns:
+        (TabPFNClassifier, TabPFNRegressor), or (None, None) if
+        tabpfn-client is not installed.
+    """
+    try:
+        # Import TabPFN classes (CACHE_DIR already patched above at module level)
+        from tabpfn_client import TabPFNClassifier as ClientClassifier
+        from tabpfn_client import TabPFNRegressor as ClientRegressor
+    except ImportError:
+        return None, None
+    logger.info(f"[INIT] TabPFN client available (cache at {_ensure_cache_dir()})")
+
+    _bootstrap_client_auth()
+    return ClientClassifier, ClientRegressor
+
+
+@functools.lru_cache(maxsize=1)
+def _load_local_backend() -> Tuple[Any, Any]:
+    """
+    Import the local tabpfn estimators, once.
+
+    Returns:
+        (TabPFNClassifier, TabPFNRegressor), or (None, None) if tabpfn is
+        not installed.
+    """
+    try:
+        from tabpfn import TabPFNClassifier as LocalClassifier
+        from tabpfn import TabPFNRegressor as LocalRegressor
+    except ImportError:
+        return None, None
+    return LocalClassifier, LocalRegressor
+
+
+@functools.lru_cache(maxsize=1)
+def _find_dotenv_file() -> Optional[Path]:
+    """
+    Nearest .env file in this module's directory or up to 3 parents.
+
+    One stat per candidate directory, stopping at the first hit or at the
+    filesystem root; the result (including "none found") is cached, so the
+    walk runs once per process.
+    """
+    # Try to find .env in project root (up to 3 levels up from this file)
+    for directory in Path(__file__).resolve().parents[:4]:
+        env_file = directory / ".env"
+        if env_file.is_file():
+            return env_file
+    return None
+
+
+def _load_dotenv_file() -> None:
+    """Load the nearest .env file (this directory or up to 3 parents)."""
+    env_file = _find_dotenv_file()
+    if env_file is None:
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        logger.debug("python-dotenv not installed, skipping .env file loading")
+        return
+    load_dotenv(env_file)
+    logger.info(f"Loaded .env file from {env_file}")
+
+
+# Token file contents keyed on (path, mtime_ns, size): re-reads are skipped
+# until the file changes
+_token_file_cache: dict = {}
+
+
+def _read_token_file(token_file: Path) -> Optional[str]:
+    """Stripped contents of token_file, or None if it is missing or unreadable."""
+    try:
+        file_stat = token_file.stat()
+    except OSError:
+        return None
+    fingerprint = (str(token_file), file_stat.st_mtime_ns, file_stat.st_size)
+    if fingerprint not in _token_file_cache:
+        try:
+            _token_file_cache.clear()
+            _token_file_cache[fingerprint] = token_file.read_text().strip()
+        except Exception as e:
+            logger.warning(f"Failed to load TabPFN token from file: {e}")
+            return None
+    return _token_file_cache[fingerprint]
+
+
+def _iter_token_sources() -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Yield (source, token) candidates in priority order.
+
+    Each source is only consulted when the previous ones gave nothing, so a
+    consumer that stops at the first token skips the rest (including the
+    .env walk and the token file read).
+    """
+    # Priority 1: Streamlit secrets (for deployed apps)
     try:
         import streamlit as st
-        if hasattr(st, 'secrets') and 'TABPFN_ACCESS_TOKEN' in st.secrets:
-            _token = st.secrets['TABPFN_ACCESS_TOKEN']
-            logger.info("TabPFN token loaded from Streamlit secrets")
-        elif hasattr(st, 'secrets') and 'TABPFN_TOKEN' in st.secrets:
-            _token = st.secrets['TABPFN_TOKEN']
-            logger.info("TabPFN token loaded from Streamlit secrets")
+        if hasattr(st, 'secrets'):
+            for key in ("TABPFN_ACCESS_TOKEN", "TABPFN_TOKEN"):
+                if key in st.secrets:
+                    yield "Streamlit secrets", st.secrets[key]
     except (ImportError, FileNotFoundError, KeyError):
         # Streamlit not available or secrets not configured
         pass
 
-    # Priority 2: Check .env file (for local development)
-    if not _token:
-        try:
-            from dotenv import load_dotenv
-            # Try to find .env in project root (up to 3 levels up from this file)
-            current_dir = Path(__file__).parent
-            for _ in range(4):  # Check current and up to 3 parent directories
-                env_file = current_dir / ".env"
-                if env_file.exists():
-                    load_dotenv(env_file)
-                    logger.info(f"Loaded .env file from {env_file}")
-                    break
-                current_dir = current_dir.parent
-        except ImportError:
-            logger.debug("python-dotenv not installed, skipping .env file loading")
-
-    # Priority 3: Check environment variable
-    if not _token:
-        _token = os.environ.get("TABPFN_ACCESS_TOKEN") or os.environ.get("TABPFN_TOKEN")
-        if _token:
-            logger.info("TabPFN token loaded from environment variable")
-
-    # Priority 4: Check stored token file
-    if not _token:
-        _token_file = Path.home() / ".tabpfn" / "token"
-        if _token_file.exists():
-            try:
-                _token = _token_file.read_text().strip()
-                logger.info("TabPFN token loaded from ~/.tabpfn/token")
-            except Exception as e:
-                logger.warning(f"Failed to load TabPFN token from file: {e}")
+    # Priority 2: .env file (for local development), read into the environment
+    # Priority 3: environment variables
+    _load_dotenv_file()
+    yield "environment variable", os.environ.get("TABPFN_ACCESS_TOKEN")
+    yield "environment variable", os.environ.get("TABPFN_TOKEN")
+
+    # Priority 4: stored token file
+    yield "~/.tabpfn/token", _read_token_file(Path.home() / ".tabpfn" / "token")
+
+
+@functools.lru_cache(maxsize=1)
+def _bootstrap_client_auth() -> None:
+    """Auto-load token from Streamlit secrets, environment, or stored file."""
+    import tabpfn_client
+
+    source, token = next(
+        ((source, value) for source, value in _iter_token_sources() if value),
+        (None, None),
+    )
+    if token:
+        logger.info(f"TabPFN token loaded from {source}")
 
     # Set the token if found
-    if _token:
+    if token:
         # CRITICAL FIX: Use ServiceClient.authorize() directly to bypass file cache
         # The standard set_access_token() calls UserAuthenticationClient.set_token() which:
         #   1. Calls ServiceClient.authorize() (in-memory) ✓
@@ -174,14 +369,14 @@ try:
         # By calling ServiceClient.authorize() directly, we skip the file write entirely.
         try:
             from tabpfn_client.config import ServiceClient, Config
-            ServiceClient.authorize(_token)
+            ServiceClient.authorize(token)
             Config.is_initialized = True
             logger.info("TabPFN authenticated via ServiceClient.authorize() (no file cache)")
         except Exception as e:
             logger.warning(f"ServiceClient.authorize() failed: {e}")
             # Fallback: try the standard method (works on writable filesystems)
             try:
-                tabpfn_client.set_access_token(_token)
+                tabpfn_client.set_access_token(token)
                 logger.info("TabPFN authenticated via set_access_token()")
             except PermissionError as perm_e:
                 logger.warning(f"Cannot authenticate TabPFN (read-only filesystem): {perm_e}")
@@ -193,17 +388,66 @@ try:
             "  3. Environment variable: TABPFN_ACCESS_TOKEN\n"
             "  4. Token file: ~/.tabpfn/token"
         )
-except ImportError:
-    ClientClassifier = None
-    ClientRegressor = None
 
-try:
-    from tabpfn import TabPFNClassifier as LocalClassifier
-    from tabpfn import TabPFNRegressor as LocalRegressor
-    _TABPFN_LOCAL_AVAILABLE = True
-except ImportError:
-    LocalClassifier = None
-    LocalRegressor = None
+
+_LAZY_BACKEND_ATTRS = {
+    "ClientClassifier": (_load_client_backend, 0),
+    "ClientRegressor": (_load_client_backend, 1),
+    "LocalClassifier": (_load_local_backend, 0),
+    "LocalRegressor": (_load_local_backend, 1),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_BACKEND_ATTRS:
+        loader, index = _LAZY_BACKEND_ATTRS[name]
+        return loader()[index]
+    if name == "_TABPFN_CLIENT_AVAILABLE":
+        return _load_client_backend()[0] is not None
+    if name == "_TABPFN_LOCAL_AVAILABLE":
+        return _load_local_backend()[0] is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _narrow_float_features(*arrays: np.ndarray) -> list:
+    """
+    Cast float64 feature arrays to float32 when every value round-trips.
+
+    Follows pd.to_numeric(downcast="float"): float32 is used only if no
+    value overflows (e.g. 1e300) or moves by more than
+    FLOAT32_ROUND_TRIP_ATOL (e.g. 14-digit ids, integers past 2**24).
+    Otherwise all arrays are returned unchanged, so they keep one dtype.
+    """
+    with np.errstate(over="ignore"):
+        narrowed = [array.astype(np.float32) for array in arrays]
+    for small, full in zip(narrowed, arrays):
+        if not np.allclose(small, full, rtol=0.0, atol=FLOAT32_ROUND_TRIP_ATOL, equal_nan=True):
+            return list(arrays)
+    return narrowed
+
+
+def _as_feature_array(X, dtype: Optional[np.dtype] = np.float32) -> np.ndarray:
+    """
+    Features as one C-contiguous array, converted once.
+
+    Numeric features are cast to dtype. The default float32 (the precision
+    TabPFN computes in, at half the bytes of float64) is only used when
+    every value round-trips (see _narrow_float_features); otherwise they
+    stay float64. Anything else, or dtype=None, keeps NumPy's default
+    conversion.
+    """
+    if isinstance(X, pd.DataFrame):
+        numeric = all(col_dtype.kind in "biuf" for col_dtype in X.dtypes)
+        X = X.to_numpy(dtype=np.float64) if numeric and dtype is not None else X.to_numpy()
+    else:
+        X = np.asarray(X)
+        numeric = X.dtype.kind in "biuf"
+    if dtype is None or not numeric:
+        return np.ascontiguousarray(X)
+    if np.dtype(dtype) == np.float32 and X.dtype != np.float32:
+        (X,) = _narrow_float_features(X.astype(np.float64, copy=False))
+        return np.ascontiguousarray(X)
+    return np.ascontiguousarray(X, dtype=dtype)
 
 
 class TabPFNWrapper:
@@ -224,6 +468,8 @@ class TabPFNWrapper:
         task_type: Literal["classification", "regression"] = "classification",
         prefer_local: Optional[bool] = None,
         timeout: float = 60.0,
+        input_dtype: Optional[np.dtype] = np.float32,
+        use_alarm: bool = False,
     ):
         """
         Initialize TabPFN wrapper.
@@ -233,13 +479,25 @@ class TabPFNWrapper:
             prefer_local: If True, try local TabPFN before cloud API.
                          Defaults to TABPFN_PREFER_LOCAL env var (default: True).
             timeout: Timeout in seconds for API calls.
+            input_dtype: Dtype numeric features are cast to before reaching
+                the backend (default float32: half the payload of float64
+                for the cloud API, used only when no value changes; else
+                float64). None passes them through unchanged.
+            use_alarm: Time fit/predict inline with SIGALRM when called on a
+                POSIX main thread, instead of on a worker thread (see
+                _run_with_timeout). The alarm can interrupt any code the
+                backend runs, so this is opt-in.
         """
         self.task_type = task_type
         self.prefer_local = prefer_local if prefer_local is not None else _PREFER_LOCAL_DEFAULT
         self.timeout = timeout
+        self.input_dtype = input_dtype
+        self.use_alarm = use_alarm
         self.backend: Optional[str] = None
         self.model: Optional[Any] = None
         self._fitted = False
+        # Cancellation token of the latest timed call; set when it times out
+        self._cancel = threading.Event()
 
         self._initialize_backend()
 
@@ -267,7 +525,8 @@ class TabPFNWrapper:
 
     def _init_client(self) -> bool:
         """Initialize tabpfn-client backend."""
-        if not _TABPFN_CLIENT_AVAILABLE:
+        ClientClassifier, ClientRegressor = _load_client_backend()
+        if ClientClassifier is None:
             return False
 
         try:
@@ -285,7 +544,8 @@ class TabPFNWrapper:
 
     def _init_local(self) -> bool:
         """Initialize local tabpfn backend."""
-        if not _TABPFN_LOCAL_AVAILABLE:
+        LocalClassifier, LocalRegressor = _load_local_backend()
+        if LocalClassifier is None:
             return False
 
         try:
@@ -316,8 +576,7 @@ class TabPFNWrapper:
             raise RuntimeError("TabPFN backend not initialized")
 
         # Convert pandas to numpy if needed
-        if isinstance(X, pd.DataFrame):
-            X = X.values
+        X = _as_feature_array(X, self.input_dtype)
         if isinstance(y, pd.Series):
             y = y.values
 
@@ -331,15 +590,40 @@ class TabPFNWrapper:
         return self
 
     def _fit_with_timeout(self, X: np.ndarray, y: np.ndarray) -> None:
-        """Internal fit with timeout using ThreadPoolExecutor."""
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(self.model.fit, X, y)
-            try:
-                future.result(timeout=self.timeout)
-            except FuturesTimeoutError:
-                raise TabPFNTimeoutError(
-                    f"TabPFN fit timed out after {self.timeout}s"
-                )
+        """Internal fit with timeout (worker thread, or SIGALRM if use_alarm)."""
+        self._cancel = cancel = threading.Event()
+        _run_with_timeout(
+            self.model.fit, self.timeout, "TabPFN fit", X, y,
+            cancel=cancel, use_alarm=self.use_alarm,
+        )
+
+    def _predict_with_timeout(self, predict_fn, X: np.ndarray, description: str) -> np.ndarray:
+        """
+        Run predict_fn over X in PREDICT_CHUNK_ROWS chunks with timeout.
+
+        Chunks are predicted one after another inside a single timed call
+        (the backend never gets concurrent requests from one prediction), and
+        their results are concatenated along axis 0 (rows of predictions or
+        of class probabilities). The timeout covers the whole prediction; on
+        timeout the cancellation token stops the loop before the next chunk,
+        so no further backend calls are made for a discarded result.
+        """
+        self._cancel = cancel = threading.Event()
+
+        def run_chunks() -> Optional[np.ndarray]:
+            if len(X) <= PREDICT_CHUNK_ROWS:
+                return predict_fn(X)
+            results = []
+            # Row slices of a C-contiguous array are contiguous views, not copies
+            for start in range(0, len(X), PREDICT_CHUNK_ROWS):
+                if cancel.is_set():
+                    return None
+                results.append(predict_fn(X[start:start + PREDICT_CHUNK_ROWS]))
+            return np.concatenate(results)
+
+        return _run_with_timeout(
+            run_chunks, self.timeout, description, cancel=cancel, use_alarm=self.use_alarm
+        )
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
@@ -350,14 +634,15 @@ class TabPFNWrapper:
 
         Returns:
             Predictions (n_samples,).
+
+        Raises:
+            TabPFNTimeoutError: If prediction exceeds timeout.
         """
         if not self._fitted:
             raise RuntimeError("Model not fitted. Call fit() first.")
 
-        if isinstance(X, pd.DataFrame):
-            X = X.values
-
-        return self.model.predict(X)
+        X = _as_feature_array(X, self.input_dtype)
+        return self._predict_with_timeout(self.model.predict, X, "TabPFN predict")
 
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
         """
@@ -368,6 +653,9 @@ class TabPFNWrapper:
 
         Returns:
             Class probabilities (n_samples, n_classes).
+
+        Raises:
+            TabPFNTimeoutError: If prediction exceeds timeout.
         """
         if not self._fitted:
             raise RuntimeError("Model not fitted. Call fit() first.")
@@ -375,10 +663,10 @@ class TabPFNWrapper:
         if self.task_type != "classification":
             raise ValueError("predict_proba only available for classification")
 
-        if isinstance(X, pd.DataFrame):
-            X = X.values
-
-        return self.model.predict_proba(X)
+        X = _as_feature_array(X, self.input_dtype)
+        return self._predict_with_timeout(
+            self.model.predict_proba, X, "TabPFN predict_proba"
+        )
 
     def score(self, X: np.ndarray, y: np.ndarray) -> float:
         """
@@ -394,8 +682,7 @@ class TabPFNWrapper:
         if not self._fitted:
             raise RuntimeError("Model not fitted. Call fit() first.")
 
-        if isinstance(X, pd.DataFrame):
-            X = X.values
+        X = _as_feature_array(X, self.input_dtype)
         if isinstance(y, pd.Series):
             y = y.values
 
@@ -429,14 +716,14 @@ def is_tabpfn_available() -> Tuple[bool, str]:
     Returns:
         Tuple of (available, backend_name).
     """
-    if _TABPFN_CLIENT_AVAILABLE:
+    if _load_client_backend()[0] is not None:
         return True, "client"
-    if _TABPFN_LOCAL_AVAILABLE:
+    if _load_local_backend()[0] is not None:
         return True, "local"
     return False, "none"
 
 
-@dataclass
+@dataclass(frozen=True)
 class APIConsumptionEstimate:
     """Estimate of TabPFN API consumption for quality assessment.
 
@@ -444,8 +731,33 @@ class APIConsumptionEstimate:
         api_cost = max((train_rows + test_rows) * n_cols * n_estimators, 5000)
 
     Where n_estimators = 8 (TabPFN default).
+
+    Immutable, and slotted (no per-instance __dict__). __slots__ is
+    declared by hand, as dataclass(slots=True) needs Python 3.10.
     """
 
+    __slots__ = (
+        "n_rows",
+        "n_features",
+        "n_classes",
+        "cv_calls",
+        "feature_importance_calls",
+        "shap_calls",
+        "total_calls",
+        "cost_per_cv_call",
+        "cost_per_ablation_call",
+        "total_cv_cost",
+        "total_feature_importance_cost",
+        "total_shap_cost",
+        "total_api_cost",
+        "total_cells",
+        "within_row_limit",
+        "within_feature_limit",
+        "within_class_limit",
+        "is_optimal",
+        "warnings",
+    )
+
     # Dataset dimensions
     n_rows: int
     n_features: int
@@ -475,32 +787,42 @@ class APIConsumptionEstimate:
     is_optimal: bool
 
     # Warnings
-    warnings: List[str]
+    warnings: Tuple[str, ...]
+
+    # summary() text, built once for the class; only the fields are filled
+    # in per call (not annotated, so not a dataclass field)
+    _SUMMARY_TEMPLATE = "\n".join([
+        "📊 **Dataset**: {self.n_rows:,} rows × {self.n_features} features",
+        "🏷️ **Target classes**: {self.n_classes}",
+        "",
+        "**TabPFN API Cost Formula**: `max((train_rows + test_rows) × cols × 8, 5000)`",
+        "",
+        "**API Calls & Cost Breakdown:**",
+        "  • Cross-validation (5-fold): {self.cv_calls} calls × {self.cost_per_cv_call:,} = **{self.total_cv_cost:,}**",
+        "  • Feature importance ({self.n_features}+1 ablations × 3 folds): {self.feature_importance_calls} calls = **{self.total_feature_importance_cost:,}**",
+        "  • SHAP analysis: ~{self.shap_calls} calls = **{self.total_shap_cost:,}**",
+        "",
+        "**Total API Cost**: ~{self.total_api_cost:,} units",
+    ])
+    _OPTIMAL_SUFFIX = "\n\n✅ Dataset is within TabPFN optimal limits"
+    _WARNINGS_HEADER = "\n\n⚠️ **Warnings:**"
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        # Frozen: restore slots without going through __setattr__
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
     def summary(self) -> str:
         """Human-readable summary of API consumption."""
-        lines = [
-            f"📊 **Dataset**: {self.n_rows:,} rows × {self.n_features} features",
-            f"🏷️ **Target classes**: {self.n_classes}",
-            f"",
-            f"**TabPFN API Cost Formula**: `max((train_rows + test_rows) × cols × 8, 5000)`",
-            f"",
-            f"**API Calls & Cost Breakdown:**",
-            f"  • Cross-validation (5-fold): {self.cv_calls} calls × {self.cost_per_cv_call:,} = **{self.total_cv_cost:,}**",
-            f"  • Feature importance ({self.n_features}+1 ablations × 3 folds): {self.feature_importance_calls} calls = **{self.total_feature_importance_cost:,}**",
-            f"  • SHAP analysis: ~{self.shap_calls} calls = **{self.total_shap_cost:,}**",
-            f"",
-            f"**Total API Cost**: ~{self.total_api_cost:,} units",
-        ]
-
+        base = self._SUMMARY_TEMPLATE.format(self=self)
         if self.is_optimal:
-            lines.append(f"\n✅ Dataset is within TabPFN optimal limits")
-        else:
-            lines.append(f"\n⚠️ **Warnings:**")
-            for warning in self.warnings:
-                lines.append(f"  • {warning}")
-
-        return "\n".join(lines)
+            return base + self._OPTIMAL_SUFFIX
+        return base + self._WARNINGS_HEADER + "".join(
+            f"\n  • {warning}" for warning in self.warnings
+        )
 
 
 def estimate_api_consumption(
@@ -608,5 +930,5 @@ def estimate_api_consumption(
         within_feature_limit=within_feature_limit,
         within_class_limit=within_class_limit,
         is_optimal=is_optimal,
-        warnings=warnings,
+        warnings=tuple(warnings),
     )
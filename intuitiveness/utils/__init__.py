@@ -17,6 +17,7 @@ from .common import (
     # Type detection (consolidated from assessor.py, benchmark.py)
     detect_task_type,
     detect_feature_type,
+    classify_dtype,
 
     # Text formatting (consolidated from datagouv_client.py)
     format_filesize,
@@ -50,6 +51,7 @@ __all__ = [
     # Type detection
     'detect_task_type',
     'detect_feature_type',
+    'classify_dtype',
 
     # Text formatting
     'format_filesize',
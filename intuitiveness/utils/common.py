@@ -8,6 +8,7 @@ Created: 2026-01-09 (Phase 0 - Code Simplification)
 Supports: ALL specs (utility layer)
 """
 
+from functools import lru_cache
 from typing import Optional, Literal
 from datetime import datetime
 import pandas as pd
@@ -141,9 +142,50 @@ def detect_task_type(y: pd.Series) -> Literal["classification", "regression"]:
     return "regression"
 
 
+def classify_dtype(dtype) -> Literal["numeric", "categorical", "boolean", "datetime"]:
+    """
+    Classify a column dtype, ignoring the values.
+
+    The dtype-only part of detect_feature_type: "numeric" here means a
+    numeric dtype, which detect_feature_type may still call categorical if
+    it has few unique values. Results are memoised per dtype, since the same
+    few dtype objects are queried for every column of every assessment.
+
+    Args:
+        dtype: Column dtype (e.g. series.dtype)
+
+    Returns:
+        Dtype class string
+
+    Example:
+        >>> classify_dtype(pd.Series([1.5, 2.5]).dtype)
+        'numeric'
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Hashing a categorical dtype hashes all its categories, which costs
+        # more than the lookup saves
+        return "boolean" if pd.api.types.is_bool_dtype(dtype) else "categorical"
+    try:
+        return _classify_hashable_dtype(dtype)
+    except TypeError:
+        return _classify_hashable_dtype.__wrapped__(dtype)
+
+
+@lru_cache(maxsize=128)
+def _classify_hashable_dtype(dtype) -> Literal["numeric", "categorical", "boolean", "datetime"]:
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    return "categorical"
+
+
 def detect_feature_type(
     series: pd.Series,
-    categorical_threshold: int = 10
+    categorical_threshold: int = 10,
+    unique_count: Optional[int] = None
 ) -> Literal["numeric", "categorical", "boolean", "datetime"]:
     """
     Detect the type of a feature column.
@@ -153,6 +195,7 @@ def detect_feature_type(
     Args:
         series: Feature column series
         categorical_threshold: Max unique values to consider numeric as categorical
+        unique_count: series.nunique() if already known (skips recounting)
 
     Returns:
         Feature type string
@@ -165,16 +208,14 @@ def detect_feature_type(
         >>> detect_feature_type(s)
         'categorical'
     """
-    if pd.api.types.is_bool_dtype(series):
-        return "boolean"
-    if pd.api.types.is_datetime64_any_dtype(series):
-        return "datetime"
-    if pd.api.types.is_numeric_dtype(series):
+    dtype_class = classify_dtype(series.dtype)
+    if dtype_class == "numeric":
         # Check if it's really categorical (few unique values)
-        if series.nunique() <= categorical_threshold:
+        if unique_count is None:
+            unique_count = series.nunique()
+        if unique_count <= categorical_threshold:
             return "categorical"
-        return "numeric"
-    return "categorical"
+    return dtype_class
 
 
 # =============================================================================